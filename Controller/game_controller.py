@@ -38,6 +38,7 @@ class GameController:
         # Algorithm selection
         self.selected_algo = None  # Solving algorithm
         self.selected_generation_algo = None  # Generation algorithm
+        self.maze_seed = None  # Seed of the current maze
         
         # Auto-solve mode
         self.auto_on = False
@@ -51,10 +52,11 @@ class GameController:
         # Initialize with default maze
         self.generate_maze("DFS")
     
-    def generate_maze(self, algorithm: str = "DFS"):
-        """Generate new maze with specified algorithm"""
+    def generate_maze(self, algorithm: str = "DFS", seed: Optional[int] = None):
+        """Generate new maze with specified algorithm (same seed => same maze)"""
         self.selected_generation_algo = algorithm
-        generation_model = GenerationModel(self.maze_cols, self.maze_rows, algorithm)
+        generation_model = GenerationModel(self.maze_cols, self.maze_rows, algorithm, seed=seed)
+        self.maze_seed = generation_model.seed  # Drawn by the model when seed is None
         self.maze_generated = generation_model.generate_maze()
         self.maze = self.maze_generated
         self.reset_game()
@@ -3,7 +3,19 @@ Model Package
 Contains maze generation and solving models
 """
 from Model.node_cell import Node_Cell
+from Model.maze_grid import MazeGrid
+from Model.maze_io import PackedMazeGrid
+from Model.shared_grid import SharedMazeGrid, SharedPathBuffer
+from Model.step_log import StepLog
+from Model.indexed_set import IndexedSet
+from Model.disjoint_set import DisjointSet
+from Model.active_set import ActiveSet
 from Model.maze_generator import GenerationModel
 from Model.maze_solver import SolvingModel
+from Model.maze_validator import MazeReport, validate_maze
+from Model.tree_index import TreeIndex
+from Model.distance_field import DistanceField, get_distance_field
+from Model.route_planner import RoutePlanner
+from Model.maze_prefetcher import MazePrefetcher
 
-__all__ = ['Node_Cell', 'GenerationModel', 'SolvingModel']
+__all__ = ['Node_Cell', 'MazeGrid', 'PackedMazeGrid', 'SharedMazeGrid', 'SharedPathBuffer', 'StepLog', 'IndexedSet', 'DisjointSet', 'ActiveSet', 'GenerationModel', 'SolvingModel', 'MazeReport', 'validate_maze', 'TreeIndex', 'DistanceField', 'get_distance_field', 'RoutePlanner', 'MazePrefetcher']
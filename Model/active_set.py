@@ -0,0 +1,87 @@
+"""
+Active Set
+Contains ActiveSet, the working list of the Growing Tree generator.
+
+Cells are kept in insertion order in a list with a head pointer, so the
+newest cell (the end), the oldest cell (the head) and a random cell can all
+be picked and removed in amortized O(1). Removing a cell from the middle
+leaves a tombstone, so the order of the others never changes: removals at
+the ends also drop the tombstones they uncover, random rejects tombstones,
+and the list is compacted once they outnumber the cells still in the set.
+"""
+import random
+from typing import List
+
+# Marks a removed cell (cells are non-negative lattice indices)
+_TOMBSTONE = -1
+
+# Drop the consumed prefix only once it is at least this long
+_COMPACT_MIN = 1024
+
+
+class ActiveSet:
+    """Indexable list of active cells (non-negative ints) with O(1) newest/oldest/random removal"""
+    __slots__ = ('items', 'head', 'size')
+
+    def __init__(self):
+        self.items: List[int] = []
+        self.head = 0  # items[:head] were already removed from the front
+        self.size = 0  # Cells in the set (slots after head that are not tombstones)
+
+    def push(self, value: int):
+        self.items.append(value)
+        self.size += 1
+
+    def newest(self) -> int:
+        """Index of the most recently pushed cell still in the set"""
+        return len(self.items) - 1
+
+    def oldest(self) -> int:
+        """Index of the earliest pushed cell still in the set"""
+        return self.head
+
+    def random(self, rng=random) -> int:
+        """Index of a uniformly random cell (at most half the slots are tombstones)"""
+        items, head = self.items, self.head
+        span = len(items) - head
+        while True:
+            index = head + rng.randrange(span)
+            if items[index] != _TOMBSTONE:
+                return index
+
+    def remove_at(self, index: int):
+        """Remove the cell at index (an index from newest/oldest/random)"""
+        items = self.items
+        self.size -= 1
+        if self.size == 0:
+            items.clear()
+            self.head = 0
+            return
+
+        # Both ends always hold cells, so newest/oldest are plain lookups
+        if index == len(items) - 1:
+            items.pop()
+            while items[-1] == _TOMBSTONE:
+                items.pop()
+        elif index == self.head:
+            self.head += 1
+            while items[self.head] == _TOMBSTONE:
+                self.head += 1
+        else:
+            items[index] = _TOMBSTONE
+
+        if self.size * 2 < len(items) - self.head:
+            self.items = [cell for cell in items[self.head:] if cell != _TOMBSTONE]
+            self.head = 0
+        elif self.head >= _COMPACT_MIN and self.head * 2 >= len(items):
+            del items[:self.head]
+            self.head = 0
+
+    def __getitem__(self, index: int) -> int:
+        return self.items[index]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __bool__(self) -> bool:
+        return self.size > 0
@@ -0,0 +1,89 @@
+"""
+Maze Adjacency
+Contains Adjacency, a 4-bit open-direction mask per cell built once per maze
+so searches never re-check walls or bounds while expanding nodes.
+
+The masks are built with whole-grid integer operations (one byte per cell)
+instead of a per-cell loop. An Adjacency remembers which cells were open,
+so get_adjacency() can reuse it until a wall is added or removed; changes
+between non-wall statuses (Path, Start, End, Path Found, ...) keep it valid.
+"""
+from typing import List, Tuple
+
+# Direction bits of a cell mask
+UP, RIGHT, DOWN, LEFT = 1, 2, 4, 8
+
+# Direction mask -> number of open neighbours (for bytes.translate)
+POPCOUNT = bytes(bin(mask).count('1') for mask in range(256))
+
+# Same neighbour order as the original SolvingModel.get_neighbors
+_DIRECTIONS = ((DOWN, 0, 1), (UP, 0, -1), (RIGHT, 1, 0), (LEFT, -1, 0))
+
+# Cell status -> 1 if open (anything but a wall), 0 for walls
+_OPEN_BYTES = b'\x00' + b'\x01' * 255
+
+
+def _open_cells(grid) -> bytes:
+    return bytes(grid.cells).translate(_OPEN_BYTES)
+
+
+def build_masks(open_cells: bytes, width: int, height: int) -> bytearray:
+    """Direction mask of every cell from its 0/1 open flags"""
+    size = width * height
+    if size == 0:
+        return bytearray()
+    cells = int.from_bytes(open_cells, 'little')
+    not_last_col = int.from_bytes((b'\x01' * (width - 1) + b'\x00') * height, 'little')
+    not_first_col = int.from_bytes((b'\x00' + b'\x01' * (width - 1)) * height, 'little')
+
+    # Byte i of (cells >> 8k) is cell i + k; every term is 0/1 per byte,
+    # so shifting it into its direction bit never carries into the next cell
+    row = 8 * width
+    up = cells & (cells << row)
+    down = cells & (cells >> row)
+    right = cells & (cells >> 8) & not_last_col
+    left = cells & (cells << 8) & not_first_col
+    masks = (up * UP) | (right * RIGHT) | (down * DOWN) | (left * LEFT)
+    return bytearray(masks.to_bytes(size, 'little'))
+
+
+class Adjacency:
+    """Per-cell open-direction masks of one maze, plus lookup tables per mask"""
+    __slots__ = ('width', 'height', 'open_cells', 'masks', 'offsets', 'deltas', 'junctions')
+
+    def __init__(self, grid):
+        self.width = grid.width
+        self.height = grid.height
+        self.open_cells = _open_cells(grid)
+        self.masks = build_masks(self.open_cells, self.width, self.height)
+        # For each of the 16 masks: flat index offsets and (dx, dy) of its neighbours
+        self.offsets = tuple(tuple(dx + dy * self.width for bit, dx, dy in _DIRECTIONS if mask & bit)
+                             for mask in range(16))
+        self.deltas = tuple(tuple((dx, dy) for bit, dx, dy in _DIRECTIONS if mask & bit)
+                            for mask in range(16))
+        self.junctions = None  # Cached by Model.junction_graph.get_junction_graph
+
+    def matches(self, grid) -> bool:
+        """Whether grid still has exactly the walls this table was built from"""
+        return (grid.width, grid.height) == (self.width, self.height) and _open_cells(grid) == self.open_cells
+
+    def neighbors(self, index: int) -> List[int]:
+        """Flat indices of the open neighbours of cell index"""
+        return [index + offset for offset in self.offsets[self.masks[index]]]
+
+    def neighbors_xy(self, x: int, y: int) -> List[Tuple[int, int]]:
+        """Open neighbours of (x, y)"""
+        return [(x + dx, y + dy) for dx, dy in self.deltas[self.masks[y * self.width + x]]]
+
+
+def get_adjacency(grid) -> Adjacency:
+    """Adjacency of grid, reusing the one cached on the grid while its walls are unchanged"""
+    cached = getattr(grid, '_adjacency', None)
+    if cached is not None and cached.matches(grid):
+        return cached
+    adjacency = Adjacency(grid)
+    try:
+        grid._adjacency = adjacency
+    except AttributeError:  # Grid type without a cache slot
+        pass
+    return adjacency
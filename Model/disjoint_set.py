@@ -0,0 +1,50 @@
+"""
+Disjoint Set (Union-Find)
+Contains DisjointSet over flat integer indices 0..n-1, stored in arrays.
+
+find() is iterative with path halving and union() links by set size, so
+chains stay short and there is no recursion on large mazes.
+"""
+from array import array
+
+
+class DisjointSet:
+    """Union-find over ints 0..n-1 with path halving and union by size"""
+    __slots__ = ('parent', 'size', 'count')
+
+    def __init__(self, n: int):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+        self.count = n  # Number of disjoint sets
+
+    def find(self, x: int) -> int:
+        """Representative of x's set"""
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the sets of a and b; returns False if they were already joined"""
+        ra = self.find(a)
+        rb = self.find(b)
+        if ra == rb:
+            return False
+        size = self.size
+        if size[ra] < size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        size[ra] += size[rb]
+        self.count -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def set_size(self, x: int) -> int:
+        """Number of elements in x's set"""
+        return self.size[self.find(x)]
+
+    def __len__(self) -> int:
+        return len(self.parent)
@@ -0,0 +1,137 @@
+"""
+Distance Field
+Contains DistanceField, shortest-path distances from a few points of
+interest (start, goal, collectibles) to every cell of one maze.
+
+Each point gets one BFS over the maze's adjacency masks, stored as an
+array('i') of distances (-1 = unreachable). Any distance between two
+points, or from a point to any cell, is then a single array lookup, so
+planning over k points costs k BFS runs instead of one per pair.
+
+On a perfect maze the field also keeps a TreeIndex, which answers the
+distance between any two cells in O(log n) without a BFS per point.
+"""
+from array import array
+from collections import deque
+from typing import Dict, Generator, Iterable, Optional, Tuple
+from Model.adjacency import Adjacency, get_adjacency
+from Model.maze_solver import run_steps
+from Model.tree_index import TreeIndex, tree_index_steps
+
+UNREACHABLE = -1
+
+
+def bfs_distances(adjacency: Adjacency, source: int) -> array:
+    """Distance of every cell from flat index source (-1 where unreachable)"""
+    return run_steps(bfs_steps(adjacency, source))
+
+
+def bfs_steps(adjacency: Adjacency, source: int, pause_every: int = 0) -> Generator[int, None, array]:
+    """Resumable bfs_distances: yields pause_every after every pause_every expanded cells"""
+    dist = array('i', [UNREACHABLE]) * (adjacency.width * adjacency.height)
+    if not adjacency.open_cells[source]:
+        return dist
+    masks, offsets = adjacency.masks, adjacency.offsets
+    dist[source] = 0
+    queue = deque([source])
+    pop, push = queue.popleft, queue.append
+    expanded = 0
+    pause_at = pause_every or -1
+    while queue:
+        current = pop()
+        expanded += 1
+        if expanded == pause_at:
+            pause_at += pause_every
+            yield pause_every
+        step = dist[current] + 1
+        for offset in offsets[masks[current]]:
+            neighbor = current + offset
+            if dist[neighbor] < 0:
+                dist[neighbor] = step
+                push(neighbor)
+    return dist
+
+
+class DistanceField:
+    """Per-maze BFS distance arrays, one per point of interest"""
+
+    def __init__(self, grid):
+        self.adjacency = get_adjacency(grid)
+        self.width = grid.width
+        self.fields: Dict[int, array] = {}  # Flat source index -> distances
+        self.tours: Dict[tuple, tuple] = {}  # Memo of Model.tour_planner.plan_tour
+        self._tree: Optional[TreeIndex] = None
+        self._tree_checked = False
+
+    @property
+    def tree(self) -> Optional[TreeIndex]:
+        """TreeIndex of the maze (built on first use), or None if the maze is not perfect"""
+        if not self._tree_checked:
+            run_steps(self.tree_steps())
+        return self._tree
+
+    def tree_steps(self, pause_every: int = 0) -> Generator[int, None, Optional[TreeIndex]]:
+        """Resumable tree: builds the TreeIndex in slices of pause_every cells"""
+        if not self._tree_checked:
+            self._tree = yield from tree_index_steps(self.adjacency, pause_every)
+            self._tree_checked = True
+        return self._tree
+
+    def matches(self, grid) -> bool:
+        """Whether grid still has the walls these distances were computed on"""
+        return self.adjacency.matches(grid)
+
+    def add(self, pos: Tuple[int, int]) -> array:
+        """Distance array from pos, running its BFS on first use"""
+        source = pos[1] * self.width + pos[0]
+        field = self.fields.get(source)
+        if field is None:
+            field = self.fields[source] = bfs_distances(self.adjacency, source)
+        return field
+
+    def add_steps(self, pos: Tuple[int, int], pause_every: int) -> Generator[int, None, array]:
+        """Resumable add(): the BFS pauses every pause_every expanded cells"""
+        source = pos[1] * self.width + pos[0]
+        field = self.fields.get(source)
+        if field is None:
+            field = yield from bfs_steps(self.adjacency, source, pause_every)
+            self.fields[source] = field
+        return field
+
+    def add_points(self, points: Iterable[Tuple[int, int]]):
+        for pos in points:
+            self.add(pos)
+
+    def distance(self, a: Tuple[int, int], b: Tuple[int, int]) -> float:
+        """
+        Shortest path length from a to b, or inf if b cannot be reached
+        O(1) when either end is a known point, O(log n) on a perfect maze;
+        otherwise a becomes a known point
+        """
+        width = self.width
+        field = self.fields.get(a[1] * width + a[0])
+        target = b
+        if field is None:
+            field = self.fields.get(b[1] * width + b[0])
+            target = a
+            if field is None:
+                tree = self.tree
+                if tree is not None:
+                    return tree.distance(a, b) if tree.contains(a) and tree.contains(b) else float('inf')
+                field = self.add(a)
+                target = b
+        d = field[target[1] * width + target[0]]
+        return float('inf') if d < 0 else d
+
+
+def get_distance_field(grid) -> DistanceField:
+    """DistanceField of grid, reusing the one cached on the grid while its walls are unchanged"""
+    cached = getattr(grid, '_distances', None)
+    if cached is not None and cached.matches(grid):
+        return cached
+    field = DistanceField(grid)
+    try:
+        grid._distances = field
+    except AttributeError:  # Grid type without a cache slot
+        pass
+    return field
@@ -0,0 +1,108 @@
+"""
+Eller's Algorithm
+Row-streaming maze generation: rows are produced top to bottom and only
+the current row's set labels are kept, so memory is O(width) no matter
+how tall the maze is.
+
+Rows are bytearrays of cell statuses (0 = Wall, 1 = Path) using the same
+layout as GenerationModel: a wall border, lattice cells on odd (x, y).
+"""
+import random
+from typing import BinaryIO, Iterable, Iterator
+from Model.maze_grid import MazeGrid
+
+
+def iter_eller_rows(maze_width: int, maze_height: int, rng=random) -> Iterator[bytearray]:
+    """Yield the maze_height rows of a perfect maze, one bytearray per row"""
+    cols = (maze_width - 1) // 2
+    rows = (maze_height - 1) // 2
+
+    yield bytearray(maze_width)  # Top border
+    if cols == 0 or rows == 0:
+        for _ in range(maze_height - 1):
+            yield bytearray(maze_width)
+        return
+
+    row_sets = list(range(cols))
+    next_set = cols
+
+    for cy in range(rows):
+        last_row = cy == rows - 1
+
+        members = {}
+        for cx, set_id in enumerate(row_sets):
+            members.setdefault(set_id, []).append(cx)
+
+        # Cell row: randomly join neighbours from different sets
+        # (the last row joins all of them so everything is connected)
+        cell_row = bytearray(maze_width)
+        cell_row[1:2 * cols:2] = b'\x01' * cols
+        for cx in range(cols - 1):
+            keep, merge = row_sets[cx], row_sets[cx + 1]
+            if keep == merge or not (last_row or rng.random() < 0.5):
+                continue
+            if len(members[keep]) < len(members[merge]):
+                keep, merge = merge, keep
+            merged = members.pop(merge)
+            for member in merged:
+                row_sets[member] = keep
+            members[keep].extend(merged)
+            cell_row[2 + 2 * cx] = 1
+        yield cell_row
+
+        if last_row:
+            break
+
+        # Passage row: every set carries at least one cell down
+        below = bytearray(maze_width)
+        next_sets = [-1] * cols
+        for set_id, cells in members.items():
+            carried = [cx for cx in cells if rng.random() < 0.5]
+            if not carried:
+                carried = [rng.choice(cells)]
+            for cx in carried:
+                next_sets[cx] = set_id
+                below[1 + 2 * cx] = 1
+        for cx in range(cols):
+            if next_sets[cx] < 0:
+                next_sets[cx] = next_set
+                next_set += 1
+        row_sets = next_sets
+        yield below
+
+    # Bottom border (two wall rows when the height is even)
+    for _ in range(maze_height - 2 * rows):
+        yield bytearray(maze_width)
+
+
+def write_rows(rows: Iterable[bytearray], out: BinaryIO, chunk_rows: int = 1024) -> int:
+    """Stream rows into a binary file object in chunks; returns rows written"""
+    chunk = bytearray()
+    count = 0
+    for row in rows:
+        chunk += row
+        count += 1
+        if count % chunk_rows == 0:
+            out.write(chunk)
+            chunk = bytearray()
+    if chunk:
+        out.write(chunk)
+    return count
+
+
+def fill_grid(rows: Iterable[bytearray], grid: MazeGrid, y: int = 0, chunk_rows: int = 1024) -> int:
+    """Copy streamed rows into grid starting at row y, in chunks; returns rows written"""
+    width = grid.width
+    start = y * width
+    chunk = bytearray()
+    count = 0
+    for row in rows:
+        chunk += row
+        count += 1
+        if count % chunk_rows == 0:
+            grid.cells[start:start + len(chunk)] = chunk
+            start += len(chunk)
+            chunk = bytearray()
+    if chunk:
+        grid.cells[start:start + len(chunk)] = chunk
+    return count
@@ -0,0 +1,53 @@
+"""
+Indexed Set
+Contains IndexedSet, a set of small non-negative ints that supports O(1)
+add, remove, membership and uniform random selection.
+
+Members live in a dense list; a position array maps each value to its slot
+so removal can swap the last member into the freed slot.
+"""
+import random
+from array import array
+from typing import Iterator
+
+
+class IndexedSet:
+    """Set of ints in range(capacity) with O(1) add/remove/choice"""
+    __slots__ = ('items', 'position')
+
+    def __init__(self, capacity: int, full: bool = False):
+        if full:
+            self.items = list(range(capacity))
+            self.position = array('i', range(capacity))
+        else:
+            self.items = []
+            self.position = array('i', [-1]) * capacity
+
+    def add(self, value: int):
+        if self.position[value] < 0:
+            self.position[value] = len(self.items)
+            self.items.append(value)
+
+    def remove(self, value: int):
+        """Remove value if present (swaps the last member into its slot)"""
+        slot = self.position[value]
+        if slot < 0:
+            return
+        last = self.items.pop()
+        self.position[value] = -1
+        if last != value:
+            self.items[slot] = last
+            self.position[last] = slot
+
+    def choice(self, rng=random) -> int:
+        """Uniformly random member"""
+        return self.items[rng.randrange(len(self.items))]
+
+    def __contains__(self, value: int) -> bool:
+        return self.position[value] >= 0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.items)
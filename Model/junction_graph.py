@@ -0,0 +1,155 @@
+"""
+Junction Graph
+Contains JunctionGraph, a maze with its corridors contracted: nodes are the
+cells that do not have exactly two open neighbours (dead ends, junctions),
+and each edge is a corridor between two nodes, weighted by its length.
+
+Searches run on this much smaller graph and only walk the corridors of the
+path they return to turn it back into cells. A query endpoint inside a
+corridor splits it for that query only: the endpoint is joined to the
+nodes at both ends (or straight to the other endpoint if they share the
+corridor), and those nodes reach it instead of passing through it.
+"""
+import re
+from collections import deque
+from typing import Dict, Generator, List, Tuple
+from Model.adjacency import POPCOUNT, Adjacency
+
+# Cells with 1, 3 or 4 open neighbours; walls and isolated cells have none
+_NODE = re.compile(rb'[\x01\x03\x04]')
+
+# (target node, corridor length, offset of the first step)
+Edge = Tuple[int, int, int]
+
+
+class JunctionGraph:
+    """Corridor-contracted graph of one maze (flat cell indices as node ids)"""
+    __slots__ = ('width', 'masks', 'offsets', 'degree', 'edges')
+
+    def __init__(self, adjacency: Adjacency):
+        """Empty graph of adjacency's maze; build_steps() fills in the edges"""
+        self.width = adjacency.width
+        self.masks = adjacency.masks
+        self.offsets = adjacency.offsets
+        self.degree = self.masks.translate(POPCOUNT)
+        self.edges: Dict[int, List[Edge]] = {}
+
+    def build_steps(self, pause_every: int = 0) -> Generator[int, None, None]:
+        """
+        Walk each corridor once, from the end met first, and record it at both ends
+        Yields pause_every after about every pause_every nodes and cells walked
+        """
+        degree, masks, offsets, edges = self.degree, self.masks, self.offsets, self.edges
+        walked = set()  # (node, first step offset) of corridors already recorded
+        work = 0
+        pause_at = pause_every or -1
+        for match in _NODE.finditer(degree):
+            node = match.start()
+            work += 1
+            own = edges.get(node)
+            if own is None:
+                own = edges[node] = []
+            for offset in offsets[masks[node]]:
+                if (node, offset) in walked:
+                    continue
+                prev, current, length = node, node + offset, 1
+                while degree[current] == 2 and current != node:
+                    first, second = offsets[masks[current]]
+                    following = current + first
+                    if following == prev:
+                        following = current + second
+                    prev, current = current, following
+                    length += 1
+                work += length
+                if current == node:
+                    continue  # Corridor looping back to its node
+                own.append((current, length, offset))
+                far = edges.get(current)
+                if far is None:
+                    far = edges[current] = []
+                far.append((node, length, prev - current))
+                walked.add((current, prev - current))
+
+            if work >= pause_at > 0:
+                pause_at = work + pause_every
+                yield pause_every
+
+    def is_node(self, index: int) -> bool:
+        return self.degree[index] != 2
+
+    def walk(self, index: int, offset: int, stop: int = -1) -> Tuple[int, int]:
+        """(end, length) of the corridor leaving index by offset, ending at a node, stop or index"""
+        degree, masks, offsets = self.degree, self.masks, self.offsets
+        prev, current, length = index, index + offset, 1
+        while degree[current] == 2 and current != stop and current != index:
+            first, second = offsets[masks[current]]
+            following = current + first
+            if following == prev:
+                following = current + second
+            prev, current = current, following
+            length += 1
+        return current, length
+
+    def expand(self, index: int, offset: int, end: int) -> List[int]:
+        """Cells of the corridor from index (excluded) by offset up to end (included)"""
+        masks, offsets = self.masks, self.offsets
+        prev, current = index, index + offset
+        cells = [current]
+        while current != end:
+            first, second = offsets[masks[current]]
+            following = current + first
+            if following == prev:
+                following = current + second
+            prev, current = current, following
+            cells.append(current)
+        return cells
+
+    def query_edges(self, start: int, goal: int) -> Dict[int, List[Edge]]:
+        """
+        Edge lists that differ from self.edges for a start -> goal query
+        An endpoint inside a corridor splits it: it gets edges to both ends,
+        and the nodes at those ends reach it instead of passing through it
+        """
+        extra: Dict[int, List[Edge]] = {}
+        if not self.is_node(start):
+            extra[start] = self.__split(extra, start, goal)
+        if not self.is_node(goal) and goal != start:
+            self.__split(extra, goal, start)
+        return extra
+
+    def __split(self, extra: Dict[int, List[Edge]], cell: int, other: int) -> List[Edge]:
+        """Join corridor cell to both ends of its corridor; returns its own edges"""
+        own = []
+        for offset in self.offsets[self.masks[cell]]:
+            end, length = self.walk(cell, offset, other)
+            if end == cell:
+                continue  # Corridor loop without any node
+            own.append((end, length, offset))
+            if end == other and not self.is_node(other):
+                continue  # Both endpoints share the corridor; other links itself
+            # end's edge into this corridor now stops at cell
+            back = self.expand(cell, offset, end)
+            first_step = (back[-2] if len(back) > 1 else cell) - end
+            edges = extra[end] if end in extra else self.edges.get(end, [])
+            extra[end] = [edge for edge in edges if edge[2] != first_step] + [(cell, length, first_step)]
+        return own
+
+
+def get_junction_graph(adjacency: Adjacency) -> JunctionGraph:
+    """JunctionGraph of the maze, built once per Adjacency"""
+    graph = adjacency.junctions
+    if graph is None:
+        graph = JunctionGraph(adjacency)
+        deque(graph.build_steps(), maxlen=0)
+        adjacency.junctions = graph
+    return graph
+
+
+def junction_graph_steps(adjacency: Adjacency, pause_every: int = 0) -> Generator[int, None, JunctionGraph]:
+    """Resumable get_junction_graph: the build pauses every pause_every nodes and cells walked"""
+    graph = adjacency.junctions
+    if graph is None:
+        graph = JunctionGraph(adjacency)
+        yield from graph.build_steps(pause_every)
+        adjacency.junctions = graph  # Only cached once complete
+    return graph
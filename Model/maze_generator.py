@@ -6,33 +6,117 @@ Contains GenerationModel class with various maze generation algorithms:
 - Binary Tree
 - Wilson's Algorithm
 - Recursive Division
+- Eller's Algorithm (row by row)
+- Growing Tree (newest / random / oldest / mixed cell selection)
+
+Every algorithm is written as a step generator that edits a grid and yields
+(x, y, action) right after each cell change, so animation can consume steps
+lazily through iter_steps() / apply_next_step() instead of buffering them.
 """
 import random
-from typing import List, Tuple, Optional
-from Model.node_cell import Node_Cell
+from collections import deque
+from typing import Iterable, Iterator, List, Tuple, Optional
+from Model.maze_grid import MazeGrid
+from Model.indexed_set import IndexedSet
+from Model.disjoint_set import DisjointSet
+from Model.active_set import ActiveSet
+from Model.eller import iter_eller_rows, fill_grid
+from Model.step_log import StepLog
+from Model.maze_io import open_maze, save_maze
+from Model.shared_grid import SharedMazeGrid
+from Model.maze_validator import MazeReport, validate_maze
+from Model.stitched_maze import generate_stitched, REGION_CELLS
+
+# Number of most recent steps kept for the generation highlight effect
+RECENT_STEPS = 16
+
+# Choices for Recursive Division's wall orientation (horizontal or not)
+_ORIENTATIONS = (True, False)
+
+# Cell selection policies of the Growing Tree generator
+GROWING_TREE_POLICIES = ("newest", "random", "oldest", "mixed")
 
 
 class GenerationModel:
     """Model for generating mazes using various algorithms"""
-    
-    def __init__(self, maze_width: int, maze_height: int, algorithm: str):
+
+    def __init__(self, maze_width: int, maze_height: int, algorithm: str, seed: Optional[int] = None):
         self.maze_width = maze_width
         self.maze_height = maze_height
         self.Algorithm = algorithm
-        self.Maze = [[Node_Cell(x, y, 0, False, float('inf'), float('inf')) 
-                     for x in range(maze_width)] 
-                     for y in range(maze_height)]
+
+        # Private RNG: the same seed always gives the same maze, and the
+        # global random module (particles, collectibles, ...) is left alone.
+        # Without a seed one is drawn, so every maze can be saved and rebuilt
+        self.seed = seed if seed is not None else random.getrandbits(63)
+        self.rng = random.Random(self.seed)
+        self.Maze = MazeGrid(maze_width, maze_height)
         self.Maze_Backup = self.Maze
-        
+
         # Generation properties
         self.start_pos: Optional[Tuple[int, int]] = (1, 1)
         self.end_pos: Optional[Tuple[int, int]] = (maze_width - 2, maze_height - 2)
         self.generation_complete = False
-        
+
+        # Growing Tree options: which active cell to grow from, and for
+        # "mixed" the chance of taking the newest cell instead of a random one
+        self.growing_tree_policy = "newest"
+        self.growing_tree_mix = 0.5
+
         # Animation support
         self.animated_generation = False
-        self.generation_steps = []  # List of (x, y, action) tuples
+        self.generation_steps = StepLog(maze_width, maze_height)  # Packed steps, only filled when recording/replaying
+        self.record_steps = False  # Record steps into generation_steps (streamed, or during generate_maze())
         self.current_step = 0
+        self.last_step: Optional[Tuple[int, int, str]] = None
+        self.recent_steps = deque(maxlen=RECENT_STEPS)
+        self._step_iter: Optional[Iterator[Tuple[int, int, str]]] = None
+        self._next_step: Optional[Tuple[int, int, str]] = None
+
+    @classmethod
+    def from_file(cls, path: str) -> 'GenerationModel':
+        """Finished model holding the maze stored in a maze file (see save_maze)"""
+        with open_maze(path) as packed:
+            model = cls(packed.width, packed.height, packed.algorithm, seed=packed.seed)
+            model.Maze = packed.to_grid()
+            model.start_pos = packed.start_pos
+            model.end_pos = packed.end_pos
+        # The file only keeps walls; put the Start/End markers back
+        model.Maze.set_status(*model.start_pos, 2)
+        model.Maze.set_status(*model.end_pos, 3)
+        model.init_maze_reset()
+        model.generation_complete = True
+        return model
+
+    @classmethod
+    def attach(cls, name: str, algorithm: str, seed: Optional[int] = None) -> 'GenerationModel':
+        """
+        Model that generates straight into an existing SharedMazeGrid block
+        (cleared to walls first), e.g. from a worker process
+        """
+        grid = SharedMazeGrid.attach(name)
+        model = cls(grid.width, grid.height, algorithm, seed=seed)
+        grid.fill(0)
+        model.Maze = grid
+        model.Maze_Backup = grid
+        return model
+
+    @staticmethod
+    def generate_shared(name: str, algorithm: str, seed: Optional[int] = None) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """
+        Process-pool entry point: generate into shared block `name`
+        Only (start, end) is returned; the maze itself is already in the block
+        """
+        model = GenerationModel.attach(name, algorithm, seed)
+        try:
+            model.generate_maze()
+            return model.start_pos, model.end_pos
+        finally:
+            model.Maze.close()
+
+    def save_maze(self, path: str):
+        """Save the generated maze (walls, seed, algorithm, start, end) to a maze file"""
+        save_maze(path, self.Maze, self.seed, self.Algorithm, self.start_pos, self.end_pos)
 
     def __get_neighbors(self, x: int, y: int) -> List[Tuple[int, int]]:
         """Get valid neighbors for maze generation (2 cells apart)"""
@@ -46,15 +130,23 @@ class GenerationModel:
 
         return neighbors
 
+    def __run(self, steps: Iterator[Tuple[int, int, str]]):
+        """Drive a step generator to completion, buffering steps in animated or recording mode"""
+        if self.animated_generation or self.record_steps:
+            self.generation_steps.extend(steps)
+        else:
+            deque(steps, maxlen=0)
+
     def DFS(self):
         """Depth-First Search maze generation algorithm"""
+        self.__run(self.__dfs_steps(self.Maze))
+
+    def __dfs_steps(self, grid: MazeGrid) -> Iterator[Tuple[int, int, str]]:
         stack = [(1, 1)]
         visited = set()
         visited.add((1, 1))
-        self.Maze[1][1].status = 1  # Path
-        
-        if self.animated_generation:
-            self.generation_steps.append((1, 1, 'path'))
+        grid.set_status(1, 1, 1)  # Path
+        yield (1, 1, 'path')
 
         while stack:
             current_x, current_y = stack[-1]
@@ -63,22 +155,20 @@ class GenerationModel:
             # Filter unvisited neighbors
             unvisited_neighbors = []
             for nx, ny in neighbors:
-                if (nx, ny) not in visited and self.Maze[ny][nx].status == 0:
+                if (nx, ny) not in visited and grid.status(nx, ny) == 0:
                     unvisited_neighbors.append((nx, ny))
 
             if unvisited_neighbors:
-                next_x, next_y = random.choice(unvisited_neighbors)
+                next_x, next_y = self.rng.choice(unvisited_neighbors)
                 visited.add((next_x, next_y))
 
                 # Break wall between current and next
                 wall_x = (current_x + next_x) // 2
                 wall_y = (current_y + next_y) // 2
-                self.Maze[wall_y][wall_x].status = 1
-                self.Maze[next_y][next_x].status = 1
-                
-                if self.animated_generation:
-                    self.generation_steps.append((wall_x, wall_y, 'break_wall'))
-                    self.generation_steps.append((next_x, next_y, 'path'))
+                grid.set_status(wall_x, wall_y, 1)
+                yield (wall_x, wall_y, 'break_wall')
+                grid.set_status(next_x, next_y, 1)
+                yield (next_x, next_y, 'path')
 
                 stack.append((next_x, next_y))
             else:
@@ -86,58 +176,52 @@ class GenerationModel:
 
     def Kruskal(self):
         """Kruskal's maze generation algorithm"""
+        self.__run(self.__kruskal_steps(self.Maze))
+
+    def __kruskal_steps(self, grid: MazeGrid) -> Iterator[Tuple[int, int, str]]:
+        cols = (self.maze_width - 1) // 2
+        rows = (self.maze_height - 1) // 2
+
+        # Initialize odd cells as paths; walls between lattice cells are
+        # encoded as cell * 2 (wall to the right) or cell * 2 + 1 (wall below)
         walls = []
+        for cy in range(rows):
+            y = 1 + 2 * cy
+            for cx in range(cols):
+                x = 1 + 2 * cx
+                grid.set_status(x, y, 1)
+                yield (x, y, 'path')
 
-        # Initialize odd cells as paths
-        for y in range(1, self.maze_height, 2):
-            for x in range(1, self.maze_width, 2):
-                self.Maze[y][x].status = 1
-                
-                if self.animated_generation:
-                    self.generation_steps.append((x, y, 'path'))
-
-                if x + 2 < self.maze_width:
-                    walls.append((x, y, x + 2, y))
-                if y + 2 < self.maze_height:
-                    walls.append((x, y, x, y + 2))
-
-        random.shuffle(walls)
-
-        # Union-Find data structure
-        parent = {}
-
-        def find(pos):
-            if pos not in parent:
-                parent[pos] = pos
-            if parent[pos] != pos:
-                parent[pos] = find(parent[pos])
-            return parent[pos]
-
-        def union(pos1, pos2):
-            p1, p2 = find(pos1), find(pos2)
-            if p1 != p2:
-                parent[p1] = p2
-                return True
-            return False
+                cell = cy * cols + cx
+                if cx + 1 < cols:
+                    walls.append(cell * 2)
+                if cy + 1 < rows:
+                    walls.append(cell * 2 + 1)
+
+        self.rng.shuffle(walls)
 
         # Break walls if cells are not connected
-        for x1, y1, x2, y2 in walls:
-            if union((x1, y1), (x2, y2)):
-                wall_x = (x1 + x2) // 2
-                wall_y = (y1 + y2) // 2
-                self.Maze[wall_y][wall_x].status = 1
-                
-                if self.animated_generation:
-                    self.generation_steps.append((wall_x, wall_y, 'break_wall'))
+        cells = DisjointSet(cols * rows)
+        for wall in walls:
+            cell, down = divmod(wall, 2)
+            if cells.union(cell, cell + cols if down else cell + 1):
+                cy, cx = divmod(cell, cols)
+                wall_x = 1 + 2 * cx + (0 if down else 1)
+                wall_y = 1 + 2 * cy + down
+                grid.set_status(wall_x, wall_y, 1)
+                yield (wall_x, wall_y, 'break_wall')
+                if cells.count == 1:
+                    break
 
     def Binary_Tree(self):
         """Binary Tree maze generation algorithm"""
+        self.__run(self.__binary_tree_steps(self.Maze))
+
+    def __binary_tree_steps(self, grid: MazeGrid) -> Iterator[Tuple[int, int, str]]:
         for y in range(1, self.maze_height, 2):
             for x in range(1, self.maze_width, 2):
-                self.Maze[y][x].status = 1
-                
-                if self.animated_generation:
-                    self.generation_steps.append((x, y, 'path'))
+                grid.set_status(x, y, 1)
+                yield (x, y, 'path')
 
                 directions = []
                 if y > 1:
@@ -146,131 +230,265 @@ class GenerationModel:
                     directions.append("left")
 
                 if directions:
-                    direction = random.choice(directions)
+                    direction = self.rng.choice(directions)
                     if direction == "up":
-                        self.Maze[y - 1][x].status = 1
-                        if self.animated_generation:
-                            self.generation_steps.append((x, y - 1, 'break_wall'))
+                        grid.set_status(x, y - 1, 1)
+                        yield (x, y - 1, 'break_wall')
                     else:
-                        self.Maze[y][x - 1].status = 1
-                        if self.animated_generation:
-                            self.generation_steps.append((x - 1, y, 'break_wall'))
+                        grid.set_status(x - 1, y, 1)
+                        yield (x - 1, y, 'break_wall')
 
     def Wilson(self):
         """Wilson's maze generation algorithm"""
-        cells = [(x, y) for y in range(1, self.maze_height, 2)
-                 for x in range(1, self.maze_width, 2)]
-
-        start = random.choice(cells)
-        self.Maze[start[1]][start[0]].status = 1
-        
-        if self.animated_generation:
-            self.generation_steps.append((start[0], start[1], 'path'))
-        
-        remaining = [cell for cell in cells if cell != start]
-
-        while remaining:
-            current = random.choice(remaining)
-            path = [current]
-
-            while self.Maze[current[1]][current[0]].status != 1:
-                neighbors = self.__get_neighbors(current[0], current[1])
-                valid_neighbors = [(x, y) for x, y in neighbors
-                                   if 1 <= x < self.maze_width - 1 and 1 <= y < self.maze_height - 1]
-
-                if valid_neighbors:
-                    next_cell = random.choice(valid_neighbors)
-
-                    if next_cell in path:
-                        path = path[:path.index(next_cell) + 1]
-                    else:
-                        path.append(next_cell)
+        self.__run(self.__wilson_steps(self.Maze))
 
-                    current = next_cell
-
-            for i in range(len(path) - 1):
-                x1, y1 = path[i]
-                x2, y2 = path[i + 1]
-
-                self.Maze[y1][x1].status = 1
-                
-                if self.animated_generation:
-                    self.generation_steps.append((x1, y1, 'path'))
-
-                wall_x = (x1 + x2) // 2
-                wall_y = (y1 + y2) // 2
-                self.Maze[wall_y][wall_x].status = 1
-                
-                if self.animated_generation:
-                    self.generation_steps.append((wall_x, wall_y, 'break_wall'))
+    def __wilson_steps(self, grid: MazeGrid) -> Iterator[Tuple[int, int, str]]:
+        """
+        Loop-erased random walks over the odd-cell lattice
+        Each walk only remembers the direction it last left every cell by, so
+        revisiting a cell overwrites (erases) the loop in O(1); unvisited cells
+        live in an IndexedSet for O(1) random pick and removal
+        """
+        cols = (self.maze_width - 1) // 2
+        rows = (self.maze_height - 1) // 2
+        count = cols * rows
+        if count == 0:
+            return
 
-            remaining = [cell for cell in remaining
-                        if self.Maze[cell[1]][cell[0]].status != 1]
+        # Lattice cell c sits at grid (1 + 2 * (c % cols), 1 + 2 * (c // cols))
+        in_tree = bytearray(count)
+        exit_dir = bytearray(count)  # 0: right, 1: left, 2: down, 3: up
+        steps = (1, -1, cols, -cols)
+        unvisited = IndexedSet(count, full=True)
+        getrandbits = self.rng.getrandbits
+
+        start = self.rng.randrange(count)
+        in_tree[start] = 1
+        unvisited.remove(start)
+        sx, sy = 1 + 2 * (start % cols), 1 + 2 * (start // cols)
+        grid.set_status(sx, sy, 1)
+        yield (sx, sy, 'path')
+
+        while len(unvisited):
+            walk_start = unvisited.choice(self.rng)
+
+            # Random walk until the tree is hit, recording only the last exit
+            cell = walk_start
+            while not in_tree[cell]:
+                cy, cx = divmod(cell, cols)
+                while True:
+                    direction = getrandbits(2)
+                    if ((direction == 0 and cx < cols - 1) or (direction == 1 and cx > 0) or
+                            (direction == 2 and cy < rows - 1) or (direction == 3 and cy > 0)):
+                        break
+                exit_dir[cell] = direction
+                cell += steps[direction]
+
+            # Retrace the loop-erased path and carve it into the tree
+            cell = walk_start
+            while not in_tree[cell]:
+                in_tree[cell] = 1
+                unvisited.remove(cell)
+                cy, cx = divmod(cell, cols)
+                x1, y1 = 1 + 2 * cx, 1 + 2 * cy
+                grid.set_status(x1, y1, 1)
+                yield (x1, y1, 'path')
+
+                direction = exit_dir[cell]
+                wall_x = x1 + (1 if direction == 0 else -1 if direction == 1 else 0)
+                wall_y = y1 + (1 if direction == 2 else -1 if direction == 3 else 0)
+                grid.set_status(wall_x, wall_y, 1)
+                yield (wall_x, wall_y, 'break_wall')
+
+                cell += steps[direction]
 
     def Recursive_Division(self):
         """Recursive Division maze generation algorithm"""
-        # Start with all paths
-        for y in range(self.maze_height):
-            for x in range(self.maze_width):
-                if y == 0 or y == self.maze_height - 1 or x == 0 or x == self.maze_width - 1:
-                    self.Maze[y][x].status = 0  # Wall
-                else:
-                    self.Maze[y][x].status = 1  # Path
-        self.__divide(1, 1, self.maze_width - 2, self.maze_height - 2)
-
-    def __divide(self, x: int, y: int, width: int, height: int):
-        """Recursively divide area into smaller sections"""
-        if width < 2 or height < 2:
-            return
-
-        horizontal = random.choice([True, False])
+        self.__run(self.__recursive_division_steps(self.Maze, trace=self.animated_generation or self.record_steps))
 
-        if horizontal and height >= 3:
-            wall_y = y + random.randrange(1, height, 2)
-
-            for wx in range(x, x + width):
-                self.Maze[wall_y][wx].status = 0
-                if self.animated_generation:
-                    self.generation_steps.append((wx, wall_y, 'build_wall'))
-
-            hole_x = x + random.randrange(0, width)
-            if hole_x % 2 == 0:
-                hole_x += 1 if hole_x < x + width - 1 else -1
-            self.Maze[wall_y][hole_x].status = 1
-            
-            if self.animated_generation:
-                self.generation_steps.append((hole_x, wall_y, 'break_wall'))
-
-            self.__divide(x, y, width, wall_y - y)
-            self.__divide(x, wall_y + 1, width, height - (wall_y - y + 1))
+    def __recursive_division_steps(self, grid: MazeGrid, trace: bool = True) -> Iterator[Tuple[int, int, str]]:
+        """
+        Divide chambers with an explicit stack instead of recursion
+        Walls are written with slice fills; per-cell 'build_wall' steps are
+        only yielded when trace is True (animation)
+        """
+        width, height = self.maze_width, self.maze_height
 
-        elif width >= 3:
-            wall_x = x + random.randrange(1, width, 2)
+        # Start with all paths inside a border of walls
+        grid.fill(0)
+        grid.fill_rect(1, 1, width - 2, height - 2, 1)
 
-            for wy in range(y, y + height):
-                self.Maze[wy][wall_x].status = 0
-                if self.animated_generation:
-                    self.generation_steps.append((wall_x, wy, 'build_wall'))
+        # Chambers are (x, y, width, height); popping the first half before
+        # the second keeps the same order (and random draws) as recursion
+        stack = [(1, 1, width - 2, height - 2)]
+        while stack:
+            x, y, width, height = stack.pop()
+            if width < 2 or height < 2:
+                continue
+
+            horizontal = self.rng.choice(_ORIENTATIONS)
+
+            if horizontal and height >= 3:
+                wall_y = y + self.rng.randrange(1, height, 2)
+
+                grid.fill_row(x, wall_y, width, 0)
+                if trace:
+                    for wx in range(x, x + width):
+                        yield (wx, wall_y, 'build_wall')
+
+                hole_x = x + self.rng.randrange(0, width)
+                if hole_x % 2 == 0:
+                    hole_x += 1 if hole_x < x + width - 1 else -1
+                grid.set_status(hole_x, wall_y, 1)
+                yield (hole_x, wall_y, 'break_wall')
+
+                stack.append((x, wall_y + 1, width, height - (wall_y - y + 1)))
+                stack.append((x, y, width, wall_y - y))
+
+            elif width >= 3:
+                wall_x = x + self.rng.randrange(1, width, 2)
+
+                grid.fill_column(wall_x, y, height, 0)
+                if trace:
+                    for wy in range(y, y + height):
+                        yield (wall_x, wy, 'build_wall')
+
+                hole_y = y + self.rng.randrange(0, height)
+                if hole_y % 2 == 0:
+                    hole_y += 1 if hole_y < y + height - 1 else -1
+                grid.set_status(wall_x, hole_y, 1)
+                yield (wall_x, hole_y, 'break_wall')
+
+                stack.append((wall_x + 1, y, width - (wall_x - x + 1), height))
+                stack.append((x, y, wall_x - x, height))
+
+    def Eller(self):
+        """Eller's maze generation algorithm (row-streaming, O(width) state)"""
+        self.__run(self.__eller_steps(self.Maze, trace=self.animated_generation or self.record_steps))
+
+    def __eller_steps(self, grid: MazeGrid, trace: bool = True) -> Iterator[Tuple[int, int, str]]:
+        rows = iter_eller_rows(self.maze_width, self.maze_height, self.rng)
+        if not trace:
+            fill_grid(rows, grid)
+            return
 
-            hole_y = y + random.randrange(0, height)
-            if hole_y % 2 == 0:
-                hole_y += 1 if hole_y < y + height - 1 else -1
-            self.Maze[hole_y][wall_x].status = 1
-            
-            if self.animated_generation:
-                self.generation_steps.append((wall_x, hole_y, 'break_wall'))
+        for y, row in enumerate(rows):
+            for x in range(self.maze_width):
+                if row[x]:
+                    grid.set_status(x, y, 1)
+                    yield (x, y, 'path' if x % 2 and y % 2 else 'break_wall')
+
+    def Growing_Tree(self):
+        """Growing Tree maze generation algorithm (policy from growing_tree_policy)"""
+        self.__run(self.__growing_tree_steps(self.Maze))
+
+    def __growing_tree_steps(self, grid: MazeGrid) -> Iterator[Tuple[int, int, str]]:
+        policy = self.growing_tree_policy
+        if policy not in GROWING_TREE_POLICIES:
+            raise ValueError(f"Unknown growing tree policy: {policy}")
+        mix = self.growing_tree_mix
+        rng = self.rng
+        cols = (self.maze_width - 1) // 2
+        rows = (self.maze_height - 1) // 2
+        if cols == 0 or rows == 0:
+            return
 
-            self.__divide(x, y, wall_x - x, height)
-            self.__divide(wall_x + 1, y, width - (wall_x - x + 1), height)
+        # Lattice cell c sits at (1 + 2 * (c % cols), 1 + 2 * (c // cols))
+        visited = bytearray(cols * rows)
+        active = ActiveSet()
+        visited[0] = 1
+        active.push(0)
+        grid.set_status(1, 1, 1)  # Path
+        yield (1, 1, 'path')
+
+        last_row = (rows - 1) * cols
+        candidates = []
+        while active:
+            if policy == "newest" or (policy == "mixed" and rng.random() < mix):
+                index = active.newest()
+            elif policy == "oldest":
+                index = active.oldest()
+            else:
+                index = active.random(rng)
+            cell = active[index]
+            cx = cell % cols
+
+            candidates.clear()
+            if cx > 0 and not visited[cell - 1]:
+                candidates.append(cell - 1)
+            if cx < cols - 1 and not visited[cell + 1]:
+                candidates.append(cell + 1)
+            if cell >= cols and not visited[cell - cols]:
+                candidates.append(cell - cols)
+            if cell < last_row and not visited[cell + cols]:
+                candidates.append(cell + cols)
+
+            if not candidates:
+                active.remove_at(index)
+                continue
+
+            nxt = candidates[rng.randrange(len(candidates))]
+            visited[nxt] = 1
+            active.push(nxt)
+
+            # Lattice cells map to odd maze coordinates; the wall is halfway
+            x, y = 1 + 2 * cx, 1 + 2 * (cell // cols)
+            next_x, next_y = 1 + 2 * (nxt % cols), 1 + 2 * (nxt // cols)
+            wall_x = (x + next_x) // 2
+            wall_y = (y + next_y) // 2
+            grid.set_status(wall_x, wall_y, 1)
+            yield (wall_x, wall_y, 'break_wall')
+            grid.set_status(next_x, next_y, 1)
+            yield (next_x, next_y, 'path')
+
+    def __algorithm_steps(self, grid: MazeGrid, trace: bool = True) -> Iterator[Tuple[int, int, str]]:
+        """Step generator of the selected algorithm running on grid (RNG restarts from seed)"""
+        self.rng = random.Random(self.seed)
+        if self.Algorithm == "DFS":
+            return self.__dfs_steps(grid)
+        elif self.Algorithm == "Kruskal":
+            return self.__kruskal_steps(grid)
+        elif self.Algorithm == "Binary_Tree":
+            return self.__binary_tree_steps(grid)
+        elif self.Algorithm == "Wilson":
+            return self.__wilson_steps(grid)
+        elif self.Algorithm == "Recursive_Division":
+            return self.__recursive_division_steps(grid, trace)
+        elif self.Algorithm == "Eller":
+            return self.__eller_steps(grid, trace)
+        elif self.Algorithm == "Growing_Tree":
+            return self.__growing_tree_steps(grid)
+        return iter(())
+
+    def __blank_maze(self) -> MazeGrid:
+        """Maze in the state the animation starts from"""
+        maze = MazeGrid(self.maze_width, self.maze_height)
+        # Nếu là Recursive Division thì bắt đầu với path bên trong viền tường
+        if self.Algorithm == "Recursive_Division":
+            maze.fill_rect(1, 1, self.maze_width - 2, self.maze_height - 2, 1)
+        return maze
+
+    def iter_steps(self) -> Iterator[Tuple[int, int, str]]:
+        """
+        Yield (x, y, action) generation steps while the selected algorithm runs
+        The algorithm works on its own scratch grid, so nothing is buffered and
+        memory stays at one extra byte per cell regardless of the step count
+        """
+        scratch = MazeGrid(self.maze_width, self.maze_height)
+        yield from self.__algorithm_steps(scratch)
 
     def __set_start_end(self):
         """Set start and end positions in the maze"""
+        # Positions start out as defaults; clear them so the scans below run
+        self.start_pos = None
+        self.end_pos = None
+
         # Find first path cell as start
         for y in range(self.maze_height):
             for x in range(self.maze_width):
-                if self.Maze[y][x].status == 1:
+                if self.Maze.status(x, y) == 1:
                     self.start_pos = (x, y)
-                    self.Maze[y][x].status = 2  # Start
+                    self.Maze.set_status(x, y, 2)  # Start
                     break
             if self.start_pos:
                 break
@@ -278,13 +496,18 @@ class GenerationModel:
         # Find last path cell as end
         for y in range(self.maze_height - 1, -1, -1):
             for x in range(self.maze_width - 1, -1, -1):
-                if self.Maze[y][x].status == 1:
+                if self.Maze.status(x, y) == 1:
                     self.end_pos = (x, y)
-                    self.Maze[y][x].status = 3  # End
+                    self.Maze.set_status(x, y, 3)  # End
                     break
             if self.end_pos:
                 break
 
+    def validate(self, goal: Optional[Tuple[int, int]] = None,
+                 collectibles: Iterable[Tuple[int, int]] = ()) -> MazeReport:
+        """Check the generated maze: perfect, and goal (default end_pos) and collectibles reachable from start"""
+        return validate_maze(self.Maze, self.start_pos, goal or self.end_pos, collectibles)
+
     def init_maze_reset(self):
         """Backup current maze state"""
         self.Maze_Backup = self.Maze
@@ -295,78 +518,122 @@ class GenerationModel:
         self.generation_complete = False
         self.start_pos = None
         self.end_pos = None
-        self.generation_steps = []
+        self.generation_steps.clear()
+        self.current_step = 0
+        self.last_step = None
+        self.recent_steps.clear()
+        self._step_iter = None
+        self._next_step = None
+
+    def __recording(self, steps: Iterator[Tuple[int, int, str]]) -> Iterator[Tuple[int, int, str]]:
+        """Pass steps through while appending them to generation_steps"""
+        for step in steps:
+            self.generation_steps.append(step)
+            yield step
+
+    def save_steps(self, path: str):
+        """Save the recorded generation trace to disk"""
+        self.generation_steps.save(path)
+
+    def load_steps(self, path: str):
+        """Load a saved generation trace; apply_next_step() will replay it"""
+        self.replay_steps(StepLog.load(path))
+
+    def replay_steps(self, steps: StepLog):
+        """Use a recorded trace; apply_next_step() will replay it from the start"""
+        if (steps.width, steps.height) != (self.maze_width, self.maze_height):
+            raise ValueError("Step log was recorded for a different maze size")
+        self.generation_steps = steps
         self.current_step = 0
+        self.last_step = None
+        self.recent_steps.clear()
+        self._step_iter = None
+        self._next_step = None
+
+    def reveal_maze(self):
+        """
+        Animate the finished maze as it is (e.g. one loaded from a file)
+        instead of generating it again: the grid restarts as solid walls and
+        apply_next_step() opens its cells row by row
+        """
+        width = self.maze_width
+        cells = self.Maze.cells
+        steps = ((x, y, 'path' if x % 2 and y % 2 else 'break_wall')
+                 for y in range(self.maze_height) for x in range(width) if cells[y * width + x])
+        self.replay_steps(StepLog(width, self.maze_height, steps))
+        self.Maze = MazeGrid(width, self.maze_height)
+        self.generation_complete = False
 
     def apply_next_step(self) -> bool:
         """
         Apply next generation step for animation
+        Steps are pulled lazily from iter_steps(), or replayed from
+        generation_steps when a trace was recorded or loaded
         Returns True if there are more steps, False if done
         """
-        if self.current_step >= len(self.generation_steps):
+        if self._step_iter is None:
+            if self.generation_steps:
+                self._step_iter = iter(self.generation_steps[self.current_step:])
+            else:
+                self._step_iter = self.iter_steps()
+                if self.record_steps:
+                    self._step_iter = self.__recording(self._step_iter)
+            self._next_step = next(self._step_iter, None)
+
+        step = self._next_step
+        if step is None:
+            self.last_step = None
             return False
-        
-        x, y, action = self.generation_steps[self.current_step]
-        
+
+        x, y, action = step
+
         if action == 'path':
-            self.Maze[y][x].status = 1
+            self.Maze.set_status(x, y, 1)
         elif action == 'break_wall':
-            self.Maze[y][x].status = 1
+            self.Maze.set_status(x, y, 1)
         elif action == 'build_wall':
-            self.Maze[y][x].status = 0
-        
+            self.Maze.set_status(x, y, 0)
+
+        self.last_step = step
+        self.recent_steps.append(step)
+        self._next_step = next(self._step_iter, None)
         self.current_step += 1
-        return self.current_step < len(self.generation_steps)
+        return self._next_step is not None
 
     def generate_maze(self):
         """Generate maze using selected algorithm"""
-        # Nếu đang ở chế độ animation, tạo một temporary maze để thu thập steps
         if self.animated_generation:
-            # Backup maze hiện tại
-            original_maze = self.Maze
-            
-            # Tạo temporary maze để chạy thuật toán
-            self.Maze = [[Node_Cell(x, y, 0, False, float('inf'), float('inf')) 
-                         for x in range(self.maze_width)] 
-                         for y in range(self.maze_height)]
-        
-        # Chạy thuật toán để thu thập steps
-        if self.Algorithm == "DFS":
-            self.DFS()
-        elif self.Algorithm == "Kruskal":
-            self.Kruskal()
-        elif self.Algorithm == "Binary_Tree":
-            self.Binary_Tree()
-        elif self.Algorithm == "Wilson":
-            self.Wilson()
-        elif self.Algorithm == "Recursive_Division":
-            self.Recursive_Division()
-
-        # Nếu đang ở chế độ animation, restore maze ban đầu
-        if self.animated_generation:
-            # Khởi tạo lại maze về trạng thái ban đầu
-            self.Maze = [[Node_Cell(x, y, 0, False, float('inf'), float('inf')) 
-                         for x in range(self.maze_width)] 
-                         for y in range(self.maze_height)]
-            
-            # Set viền ngoài là tường
-            for y in range(self.maze_height):
-                for x in range(self.maze_width):
-                    if y == 0 or y == self.maze_height - 1 or x == 0 or x == self.maze_width - 1:
-                        self.Maze[y][x].status = 0
-                    else:
-                        # Nếu là Recursive Division thì bắt đầu với path
-                        if self.Algorithm == "Recursive_Division":
-                            self.Maze[y][x].status = 1
-                        else:
-                            self.Maze[y][x].status = 0
-            
-            # Reset current step
+            # Animation mode: start from the initial state and let
+            # apply_next_step() pull steps from the algorithm as it runs
+            self.Maze = self.__blank_maze()
+            self.generation_steps.clear()
             self.current_step = 0
+            self.last_step = None
+            self.recent_steps.clear()
+            self._step_iter = None
+            self._next_step = None
         else:
-            # Chế độ bình thường - set start/end
+            # Chế độ bình thường - chạy thuật toán rồi set start/end
+            # (record_steps: keep the trace of this run for a later replay)
+            if self.record_steps:
+                self.generation_steps.clear()
+            self.__run(self.__algorithm_steps(self.Maze, trace=self.record_steps))
             self.init_maze_reset()
             self.__set_start_end()
             self.generation_complete = True
-        
+
+        return self.Maze
+
+    def generate_maze_parallel(self, workers: Optional[int] = None, region_cells: int = REGION_CELLS):
+        """
+        Generate a huge maze on several processes: regions of region_cells x
+        region_cells lattice cells are built with the selected algorithm and
+        stitched into one perfect maze (a different maze than generate_maze()
+        gives for the same seed, but reproducible for any worker count)
+        """
+        self.Maze = generate_stitched(self.maze_width, self.maze_height, self.Algorithm,
+                                      self.seed, workers, region_cells)
+        self.init_maze_reset()
+        self.__set_start_end()
+        self.generation_complete = True
         return self.Maze
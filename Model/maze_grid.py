@@ -0,0 +1,123 @@
+"""
+Compact Maze Grid
+Contains MazeGrid, a flat one-byte-per-cell replacement for the
+list-of-lists of Node_Cell objects.
+
+Cell status values follow config.CELL_STATUS:
+0 = Wall, 1 = Path, 2 = Start, 3 = End, 4 = Path Found, 5 = Moved Path
+"""
+from typing import Iterator, Tuple
+
+
+class _CellView:
+    """Read-only stand-in for Node_Cell so `maze[y][x].status` keeps working"""
+    __slots__ = ('_cells', '_index', 'x', 'y')
+
+    def __init__(self, cells, index: int, x: int, y: int):
+        self._cells = cells
+        self._index = index
+        self.x = x
+        self.y = y
+
+    @property
+    def status(self) -> int:
+        return self._cells[self._index]
+
+    def get_position(self) -> Tuple[int, int]:
+        return (self.x, self.y)
+
+    def get_status(self) -> int:
+        return self._cells[self._index]
+
+
+class _RowView:
+    """One row of a MazeGrid, indexable by x"""
+    __slots__ = ('_grid', '_y', '_offset')
+
+    def __init__(self, grid: 'MazeGrid', y: int):
+        self._grid = grid
+        self._y = y
+        self._offset = y * grid.width
+
+    def __len__(self) -> int:
+        return self._grid.width
+
+    def __getitem__(self, x: int) -> _CellView:
+        width = self._grid.width
+        if x < 0:
+            x += width
+        if not 0 <= x < width:
+            raise IndexError("maze column out of range")
+        return _CellView(self._grid.cells, self._offset + x, x, self._y)
+
+    def __iter__(self) -> Iterator[_CellView]:
+        for x in range(self._grid.width):
+            yield self[x]
+
+
+class MazeGrid:
+    """Maze stored as a flat bytearray of cell statuses (row-major, one byte per cell)"""
+    __slots__ = ('width', 'height', 'cells', '_adjacency', '_distances')
+
+    def __init__(self, width: int, height: int, fill: int = 0):
+        self.width = width
+        self.height = height
+        self.cells = bytearray([fill]) * (width * height)
+        self._adjacency = None  # Cached by Model.adjacency.get_adjacency
+        self._distances = None  # Cached by Model.distance_field.get_distance_field
+
+    def index(self, x: int, y: int) -> int:
+        """Flat index of cell (x, y)"""
+        return y * self.width + x
+
+    def status(self, x: int, y: int) -> int:
+        """Get status of cell (x, y)"""
+        return self.cells[y * self.width + x]
+
+    def set_status(self, x: int, y: int, status: int):
+        """Set status of cell (x, y)"""
+        self.cells[y * self.width + x] = status
+
+    def fill(self, status: int):
+        """Set every cell to the same status"""
+        self.cells[:] = bytes([status]) * len(self.cells)
+
+    def fill_row(self, x: int, y: int, length: int, status: int):
+        """Set `length` cells starting at (x, y) and going right"""
+        start = y * self.width + x
+        self.cells[start:start + length] = bytes([status]) * length
+
+    def fill_column(self, x: int, y: int, length: int, status: int):
+        """Set `length` cells starting at (x, y) and going down"""
+        start = y * self.width + x
+        self.cells[start:start + length * self.width:self.width] = bytes([status]) * length
+
+    def fill_rect(self, x: int, y: int, width: int, height: int, status: int):
+        """Set every cell of a width x height rectangle whose top-left is (x, y)"""
+        row = bytes([status]) * width
+        for start in range(y * self.width + x, (y + height) * self.width, self.width):
+            self.cells[start:start + width] = row
+
+    def copy(self) -> 'MazeGrid':
+        """Independent copy of this grid"""
+        grid = MazeGrid.__new__(MazeGrid)
+        grid.width = self.width
+        grid.height = self.height
+        grid.cells = bytearray(self.cells)
+        grid._adjacency = None
+        grid._distances = None
+        return grid
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, y: int) -> _RowView:
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError("maze row out of range")
+        return _RowView(self, y)
+
+    def __iter__(self) -> Iterator[_RowView]:
+        for y in range(self.height):
+            yield _RowView(self, y)
@@ -0,0 +1,315 @@
+"""
+Maze Files
+Bit-packed storage for generated mazes.
+
+Walls are stored as one bit per cell (1 = open, 0 = wall), row-major and
+most significant bit first, padded to a whole byte. Start/End and other
+status markers are not part of the bits; start and end are kept in the
+record header instead.
+
+A maze file holds one maze:
+    header : magic b'MZF1', version, width, height, seed, algorithm, start, end
+    data   : the packed cell bits
+A batch file holds many mazes of the same size and algorithm:
+    header : magic b'MZB1', version, width, height, count, algorithm
+    records: seed, start (x, y), end (x, y), then the packed cell bits
+Every record has the same size, so record i can be found without scanning.
+
+Both are opened through mmap: PackedMazeGrid reads cells straight from the
+mapped bits, so opening a million-cell maze costs no copy or decode.
+"""
+import mmap
+import struct
+from typing import BinaryIO, Iterator, Optional, Tuple
+from Model.maze_grid import MazeGrid, _RowView
+
+MAZE_VERSION = 2
+BATCH_VERSION = 2
+
+# Bytes reserved for the algorithm name ("Recursive_Division" needs 18)
+_NAME_SIZE = 32
+
+# Seeds are stored as unsigned 64-bit ints: 0 <= seed < SEED_LIMIT
+SEED_LIMIT = 1 << 64
+
+_MAZE_MAGIC = b'MZF1'
+_MAZE_HEADER = struct.Struct(f'<4sHIIQ{_NAME_SIZE}sIIII')  # magic, version, width, height, seed, algorithm, start, end
+_BATCH_MAGIC = b'MZB1'
+_BATCH_HEADER = struct.Struct(f'<4sHIII{_NAME_SIZE}s')  # magic, version, width, height, count, algorithm
+_RECORD_HEADER = struct.Struct('<QIIII')  # seed, start x, start y, end x, end y
+
+# Cell status -> '0' (wall) / '1' (anything walkable), and back
+_TO_BIT_CHARS = b'0' + b'1' * 255
+_FROM_BIT_CHARS = bytes.maketrans(b'01', b'\x00\x01')
+
+MazeRecord = Tuple[int, Tuple[int, int], Tuple[int, int], 'PackedMazeGrid']
+
+
+def packed_size(width: int, height: int) -> int:
+    """Bytes needed to pack a width x height maze"""
+    return (width * height + 7) // 8
+
+
+def pack_cells(cells: bytes) -> bytes:
+    """Pack cell statuses into wall bits (1 = open, 0 = wall)"""
+    if not cells:
+        return b''
+    bit_chars = bytes(cells).translate(_TO_BIT_CHARS)
+    padding = -len(bit_chars) % 8
+    return int(bit_chars + b'0' * padding, 2).to_bytes((len(bit_chars) + padding) // 8, 'big')
+
+
+def unpack_cells(data: bytes, count: int) -> bytearray:
+    """Unpack wall bits back into `count` cell statuses (0 = Wall, 1 = Path)"""
+    if count == 0:
+        return bytearray()
+    bits = bin(int.from_bytes(data, 'big'))[2:].zfill(len(data) * 8)
+    return bytearray(bits[:count].encode('ascii').translate(_FROM_BIT_CHARS))
+
+
+def _encode_name(algorithm: str) -> bytes:
+    name = algorithm.encode('ascii')
+    if len(name) > _NAME_SIZE:
+        raise ValueError(f"algorithm name longer than {_NAME_SIZE} characters")
+    return name
+
+
+def check_seed(seed: int):
+    """Raise ValueError unless seed fits the files' unsigned 64-bit seed field"""
+    if not 0 <= seed < SEED_LIMIT:
+        raise ValueError(f"seed {seed} cannot be stored (must be 0 <= seed < 2**64)")
+
+
+def _map_file(path: str) -> Tuple[BinaryIO, mmap.mmap]:
+    """Open path read-only and memory-map it"""
+    file = open(path, 'rb')
+    try:
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:  # Empty file
+        file.close()
+        raise ValueError(f"{path} is not a maze file")
+    return file, data
+
+
+class _PackedCells:
+    """Read-only cell sequence over packed wall bits (same indexing as MazeGrid.cells)"""
+    __slots__ = ('_data', '_offset', '_count')
+
+    def __init__(self, data, offset: int, count: int):
+        self._data = data
+        self._offset = offset
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("maze cell out of range")
+        return (self._data[self._offset + (index >> 3)] >> (7 - (index & 7))) & 1
+
+
+class PackedMazeGrid:
+    """
+    Read-only maze grid backed by packed bits (usually a memory-mapped file)
+    Supports the read side of MazeGrid: status(), index(), maze[y][x].status;
+    call to_grid() for an editable MazeGrid
+    """
+    __slots__ = ('width', 'height', 'cells', 'seed', 'algorithm', 'start_pos', 'end_pos',
+                 '_data', '_offset', '_owned')
+
+    def __init__(self, data, offset: int, width: int, height: int, seed: Optional[int] = None,
+                 algorithm: str = '', start_pos: Optional[Tuple[int, int]] = None,
+                 end_pos: Optional[Tuple[int, int]] = None):
+        self.width = width
+        self.height = height
+        self.cells = _PackedCells(data, offset, width * height)
+        self.seed = seed
+        self.algorithm = algorithm
+        self.start_pos = start_pos
+        self.end_pos = end_pos
+        self._data = data
+        self._offset = offset
+        self._owned = ()  # File objects closed by close()
+
+    def index(self, x: int, y: int) -> int:
+        """Flat index of cell (x, y)"""
+        return y * self.width + x
+
+    def status(self, x: int, y: int) -> int:
+        """Get status of cell (x, y): 0 = Wall, 1 = Path"""
+        index = y * self.width + x
+        return (self._data[self._offset + (index >> 3)] >> (7 - (index & 7))) & 1
+
+    def to_grid(self) -> MazeGrid:
+        """Decode into an editable MazeGrid"""
+        count = self.width * self.height
+        grid = MazeGrid(self.width, self.height)
+        grid.cells = unpack_cells(self._data[self._offset:self._offset + packed_size(self.width, self.height)], count)
+        return grid
+
+    def close(self):
+        """Release the mapping if this grid owns it"""
+        for resource in self._owned:
+            resource.close()
+        self._owned = ()
+
+    def __enter__(self) -> 'PackedMazeGrid':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, y: int) -> _RowView:
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError("maze row out of range")
+        return _RowView(self, y)
+
+    def __iter__(self) -> Iterator[_RowView]:
+        for y in range(self.height):
+            yield _RowView(self, y)
+
+
+def save_maze(path: str, grid: MazeGrid, seed: int, algorithm: str,
+              start: Tuple[int, int], end: Tuple[int, int]):
+    """Write one maze to a bit-packed maze file"""
+    check_seed(seed)  # Before open() truncates an existing file
+    with open(path, 'wb') as file:
+        file.write(_MAZE_HEADER.pack(_MAZE_MAGIC, MAZE_VERSION, grid.width, grid.height, seed,
+                                     _encode_name(algorithm), start[0], start[1], end[0], end[1]))
+        file.write(pack_cells(grid.cells))
+
+
+def open_maze(path: str) -> PackedMazeGrid:
+    """Memory-map a maze file; close the returned grid (or use `with`) when done"""
+    file, data = _map_file(path)
+    try:
+        if len(data) < _MAZE_HEADER.size:
+            raise ValueError(f"{path} is not a maze file")
+        magic, version, width, height, seed, name, sx, sy, ex, ey = _MAZE_HEADER.unpack_from(data)
+        if magic != _MAZE_MAGIC:
+            raise ValueError(f"{path} is not a maze file")
+        if version != MAZE_VERSION:
+            raise ValueError(f"Unsupported maze file version {version}")
+        if len(data) < _MAZE_HEADER.size + packed_size(width, height):
+            raise ValueError(f"{path} is truncated")
+    except Exception:
+        data.close()
+        file.close()
+        raise
+    grid = PackedMazeGrid(data, _MAZE_HEADER.size, width, height, seed,
+                          name.rstrip(b'\x00').decode('ascii'), (sx, sy), (ex, ey))
+    grid._owned = (data, file)
+    return grid
+
+
+def iter_maze_file(path: str) -> Iterator[PackedMazeGrid]:
+    """Yield every maze in a maze file or a batch file"""
+    with open(path, 'rb') as file:
+        magic = file.read(4)
+    if magic == _MAZE_MAGIC:
+        with open_maze(path) as grid:
+            yield grid
+    elif magic == _BATCH_MAGIC:
+        with MazeBatchReader(path) as reader:
+            for _, _, _, grid in reader:
+                yield grid
+    else:
+        raise ValueError(f"{path} is not a maze file")
+
+
+class MazeBatchWriter:
+    """Appends fixed-size maze records to a batch file (use as a context manager)"""
+
+    def __init__(self, path: str, width: int, height: int, algorithm: str):
+        self.width = width
+        self.height = height
+        self.algorithm = algorithm
+        self.count = 0
+        self._file: BinaryIO = open(path, 'wb')
+        self._write_header()
+
+    def _write_header(self):
+        self._file.write(_BATCH_HEADER.pack(_BATCH_MAGIC, BATCH_VERSION, self.width, self.height,
+                                            self.count, _encode_name(self.algorithm)))
+
+    def write(self, seed: int, start: Tuple[int, int], end: Tuple[int, int], packed: bytes):
+        """Append one maze whose cells were already packed with pack_cells()"""
+        if len(packed) != packed_size(self.width, self.height):
+            raise ValueError("packed maze has the wrong size for this batch")
+        check_seed(seed)
+        self._file.write(_RECORD_HEADER.pack(seed, start[0], start[1], end[0], end[1]))
+        self._file.write(packed)
+        self.count += 1
+
+    def close(self):
+        """Patch the record count into the header and close the file"""
+        if self._file.closed:
+            return
+        self._file.seek(0)
+        self._write_header()
+        self._file.close()
+
+    def __enter__(self) -> 'MazeBatchWriter':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class MazeBatchReader:
+    """Random access to the mazes of a memory-mapped batch file"""
+
+    def __init__(self, path: str):
+        self._file, self._data = _map_file(path)
+        try:
+            if len(self._data) < _BATCH_HEADER.size:
+                raise ValueError(f"{path} is not a maze batch file")
+            magic, version, self.width, self.height, self.count, name = _BATCH_HEADER.unpack_from(self._data)
+            if magic != _BATCH_MAGIC:
+                raise ValueError(f"{path} is not a maze batch file")
+            if version != BATCH_VERSION:
+                raise ValueError(f"Unsupported maze batch version {version}")
+        except Exception:
+            self.close()
+            raise
+        self.algorithm = name.rstrip(b'\x00').decode('ascii')
+        self._packed_size = packed_size(self.width, self.height)
+        self._record_size = _RECORD_HEADER.size + self._packed_size
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> MazeRecord:
+        """(seed, start, end, grid) of maze number index; grid reads from the mapping"""
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("maze index out of range")
+        offset = _BATCH_HEADER.size + index * self._record_size
+        seed, sx, sy, ex, ey = _RECORD_HEADER.unpack_from(self._data, offset)
+        grid = PackedMazeGrid(self._data, offset + _RECORD_HEADER.size, self.width, self.height,
+                              seed, self.algorithm, (sx, sy), (ex, ey))
+        return seed, (sx, sy), (ex, ey), grid
+
+    def __iter__(self) -> Iterator[MazeRecord]:
+        for index in range(self.count):
+            yield self[index]
+
+    def close(self):
+        """Unmap the file (grids handed out stop working)"""
+        self._data.close()
+        self._file.close()
+
+    def __enter__(self) -> 'MazeBatchReader':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,85 @@
+"""
+Maze Prefetcher
+Contains MazePrefetcher, which generates upcoming mazes on a background
+worker thread so switching levels does not stall the main loop.
+
+Each prefetched maze is a finished GenerationModel whose generation_steps
+also hold the packed animation trace, so the level can either use the maze
+directly or replay the trace without running the algorithm again.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, Optional
+from Model.maze_generator import GenerationModel
+
+# Attempts made with consecutive seeds before a prefetch gives up validating
+MAX_ATTEMPTS = 3
+
+
+def build_maze(maze_width: int, maze_height: int, algorithm: str, seed: Optional[int] = None,
+               validate: Optional[Callable[[GenerationModel], bool]] = None) -> GenerationModel:
+    """
+    Generate a finished maze plus its animation trace (recorded in the same run)
+    If validate rejects the maze, retry with the next seed; raises ValueError
+    once MAX_ATTEMPTS mazes were rejected
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        attempt_seed = None if seed is None else seed + attempt
+        model = GenerationModel(maze_width, maze_height, algorithm, seed=attempt_seed)
+        model.record_steps = True
+        model.generate_maze()
+        if validate is None or validate(model):
+            return model
+    raise ValueError(f"No valid {algorithm} maze in {MAX_ATTEMPTS} attempts")
+
+
+class MazePrefetcher:
+    """Generates mazes ahead of time on a single worker thread, keyed by e.g. level number"""
+
+    def __init__(self, validate: Optional[Callable[[GenerationModel], bool]] = None):
+        self.validate = validate
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[Hashable, Future] = {}
+
+    def prefetch(self, key: Hashable, maze_width: int, maze_height: int, algorithm: str,
+                 seed: Optional[int] = None):
+        """Start generating a maze for key in the background (replaces any older request for key)"""
+        self.cancel(key)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="maze-prefetch")
+        self._pending[key] = self._executor.submit(
+            build_maze, maze_width, maze_height, algorithm, seed, self.validate)
+
+    def is_ready(self, key: Hashable) -> bool:
+        future = self._pending.get(key)
+        return future is not None and future.done()
+
+    def take(self, key: Hashable) -> Optional[GenerationModel]:
+        """
+        Hand over the finished maze for key
+        Returns None if nothing was requested, the worker is still busy, or it
+        failed - the caller then generates synchronously
+        """
+        future = self._pending.pop(key, None)
+        if future is None:
+            return None
+        if not future.done():
+            future.cancel()
+            return None
+        if future.cancelled() or future.exception() is not None:
+            return None
+        return future.result()
+
+    def cancel(self, key: Optional[Hashable] = None):
+        """Drop the request for key, or every request when key is None"""
+        keys = list(self._pending) if key is None else [key]
+        for k in keys:
+            future = self._pending.pop(k, None)
+            if future is not None:
+                future.cancel()
+
+    def shutdown(self):
+        """Cancel pending work and stop the worker thread"""
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -6,18 +6,39 @@ Contains SolvingModel class with various pathfinding algorithms:
 - UCS (Uniform Cost Search)
 - A* (A-Star Search)
 - Bidirectional Search
+
+Solvers never write into the maze: visited and path marks of the last solve
+are kept in the model's own overlay, so several solvers can share one grid.
+
+BFS, DFS, UCS and A* search the maze's junction graph (corridors contracted
+to weighted edges) unless contract_corridors is turned off. Bidirectional
+always expands cells, since its level-by-level meeting rule needs edges of
+length one.
 """
 import time
 import heapq
+from array import array
 from collections import deque
-from typing import List, Tuple, Optional, Dict
-from Model.node_cell import Node_Cell
+from typing import Generator, List, Optional, Tuple
+from Model.maze_grid import MazeGrid
+from Model.shared_grid import SharedMazeGrid, SharedPathBuffer
+from Model.adjacency import Adjacency, get_adjacency
+from Model.junction_graph import JunctionGraph, junction_graph_steps
+
+
+def run_steps(steps: Generator):
+    """Run a resumable search (any generator) to the end and return its result"""
+    try:
+        while True:
+            next(steps)
+    except StopIteration as done:
+        return done.value
 
 
 class SolvingModel:
     """Model for solving mazes using various pathfinding algorithms"""
     
-    def __init__(self, maze_grid: List[List[Node_Cell]], maze_width: int, maze_height: int):
+    def __init__(self, maze_grid: MazeGrid, maze_width: int, maze_height: int):
         # Maze data
         self.maze_grid = maze_grid
         self.maze_width = maze_width
@@ -42,6 +63,50 @@ class SolvingModel:
         self.nodes_expanded = 0
         self.solving_time = 0.0
 
+        # Optional shared buffer that receives solution_path after each solve
+        self.path_buffer: Optional[SharedPathBuffer] = None
+
+        # Open-direction masks, shared by every solver on the same maze
+        self.adjacency: Optional[Adjacency] = None
+
+        # Visited / path marks of the last solve (built on demand); the maze
+        # itself is never written, so solves can share it across threads
+        self._overlay: Optional[bytearray] = None
+
+        # Search the corridor-contracted junction graph (BFS, DFS, UCS, A*)
+        # instead of expanding every cell
+        self.contract_corridors = True
+
+        # Flat-index search buffers, reused between solves
+        self._flags: List[bytearray] = []
+        self._parents: List[array] = []
+        self._cost = array('i')
+
+    @classmethod
+    def attach(cls, grid_name: str, path_name: Optional[str] = None) -> 'SolvingModel':
+        """Model solving the SharedMazeGrid block grid_name, writing paths to path_name"""
+        grid = SharedMazeGrid.attach(grid_name)
+        model = cls(grid, grid.width, grid.height)
+        if path_name is not None:
+            model.path_buffer = SharedPathBuffer.attach(path_name)
+        return model
+
+    @staticmethod
+    def solve_shared(grid_name: str, path_name: str, algorithm: str,
+                     start: Tuple[int, int], end: Tuple[int, int]) -> bool:
+        """
+        Process-pool entry point: solve a shared grid (left unchanged)
+        The path goes to the shared path buffer; only the found flag is returned
+        """
+        model = SolvingModel.attach(grid_name, path_name)
+        try:
+            model.start_pos = start
+            model.end_pos = end
+            return model.solve_maze(algorithm)
+        finally:
+            model.maze_grid.close()
+            model.path_buffer.close()
+
     def reset_solving_state(self):
         """Reset state for re-solving"""
         self.solution_path.clear()
@@ -53,306 +118,438 @@ class SolvingModel:
         self.nodes_expanded = 0
         self.solving_time = 0.0
 
-        # Reset visual state
-        for y in range(self.maze_height):
-            for x in range(self.maze_width):
-                if self.maze_grid[y][x].status in [4, 5]:  # Path Found, Moved Path
-                    if (x, y) == self.start_pos:
-                        self.maze_grid[y][x].status = 2  # Start
-                    elif (x, y) == self.end_pos:
-                        self.maze_grid[y][x].status = 3  # End
-                    else:
-                        self.maze_grid[y][x].status = 1  # Path
+        self._overlay = None
+
+    @property
+    def overlay(self) -> bytearray:
+        """
+        Marks of the last solve, one byte per cell: 5 (Moved Path) for visited
+        cells, 4 (Path Found) along the solution, 0 elsewhere
+        Start and end are never marked, as when solves wrote into the maze
+        """
+        if self._overlay is None:
+            width = self.maze_width
+            overlay = bytearray(width * self.maze_height)
+            for x, y in self.visited_cells:
+                overlay[y * width + x] = 5  # Moved Path
+            if self.solution_found:
+                for x, y in self.solution_path:
+                    overlay[y * width + x] = 4  # Path Found
+            for pos in (self.start_pos, self.end_pos):
+                if pos:
+                    overlay[pos[1] * width + pos[0]] = 0
+            self._overlay = overlay
+        return self._overlay
+
+    def status(self, x: int, y: int) -> int:
+        """Status of (x, y) with the last solve's marks laid over the maze"""
+        mark = self.overlay[y * self.maze_width + x]
+        return mark or self.maze_grid.status(x, y)
+
+    def refresh_adjacency(self) -> Adjacency:
+        """Fetch the maze's adjacency table (rebuilt only if walls changed)"""
+        self.adjacency = get_adjacency(self.maze_grid)
+        return self.adjacency
 
     def get_neighbors(self, x: int, y: int) -> List[Tuple[int, int]]:
         """Get valid neighboring cells (not walls)"""
-        neighbors = []
-        directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            if (0 <= nx < self.maze_width and 
-                0 <= ny < self.maze_height and 
-                self.maze_grid[ny][nx].status != 0):
-                neighbors.append((nx, ny))
-
-        return neighbors
-
-    def heuristic(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
-        """Heuristic function for A* (Manhattan distance)"""
-        return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
-
-    def reconstruct_path(self, came_from: Dict[Tuple[int, int], Optional[Tuple[int, int]]]) -> List[Tuple[int, int]]:
-        """Reconstruct path from came_from dictionary"""
+        adjacency = self.adjacency or self.refresh_adjacency()
+        return adjacency.neighbors_xy(x, y)
+
+    # ---- Flat-index search core
+    # Cells are addressed by y * width + x. Search state lives in buffers
+    # owned by the model and reused by every solve: a bytearray of per-cell
+    # flags and array('i') parent / cost arrays (parent -1 = none).
+
+    def __search_buffers(self, count: int = 1):
+        """(flags, parent, cost) buffers; flags are cleared, the rest is written before read"""
+        size = self.maze_width * self.maze_height
+        if len(self._flags) != count or len(self._flags[0]) != size:
+            self._flags = [bytearray(size) for _ in range(count)]
+            self._parents = [array('i', [-1]) * size for _ in range(count)]
+            self._cost = array('i', [0]) * size
+        else:
+            zero = bytes(size)
+            for flags in self._flags:
+                flags[:] = zero
+        return self._flags, self._parents, self._cost
+
+    def __endpoints(self) -> Tuple[int, int]:
+        width = self.maze_width
+        return (self.start_pos[1] * width + self.start_pos[0],
+                self.end_pos[1] * width + self.end_pos[0])
+
+    def __trace(self, parent: array, node: int) -> List[int]:
+        """Indices from the search root to node, following parent links"""
         path = []
-        current = self.end_pos
-
-        while current is not None:
-            path.append(current)
-            current = came_from.get(current)
-
+        while node >= 0:
+            path.append(node)
+            node = parent[node]
         path.reverse()
         return path
 
-    def BFS(self) -> bool:
-        """Breadth-First Search - Find shortest path"""
-        if not self.start_pos or not self.end_pos:
-            return False
-
-        queue = deque([self.start_pos])
-        visited = {self.start_pos}
-        came_from = {self.start_pos: None}
+    def __finish(self, path: List[int], visited: List[int]):
+        """Publish index results as (x, y) tuples"""
+        width = self.maze_width
+        self.solution_path = [(i % width, i // width) for i in path]
+        self.path_length = len(self.solution_path)
+        self.visited_cells = [(i % width, i // width) for i in visited]
+
+    def __first_search(self, breadth: bool, pause_every: int = 0) -> Generator[int, None, bool]:
+        """BFS (queue) or DFS (stack) over flat indices"""
+        start, goal = self.__endpoints()
+        (seen,), (parent,), _ = self.__search_buffers()
+        adjacency = self.adjacency or self.refresh_adjacency()
+        masks, offsets = adjacency.masks, adjacency.offsets
+        visited = []
+
+        seen[start] = 1
+        parent[start] = -1
+        frontier = deque([start])
+        take = frontier.popleft if breadth else frontier.pop
+        push = frontier.append
+        expanded = 0
+        pause_at = pause_every or -1
+
+        while frontier:
+            current = take()
+            expanded += 1
+            if expanded == pause_at:
+                pause_at += pause_every
+                yield pause_every
+
+            if current == goal:
+                self.nodes_expanded += expanded
+                self.__finish(self.__trace(parent, goal), visited)
+                return True
 
-        while queue:
-            current = queue.popleft()
-            self.nodes_expanded += 1
+            for offset in offsets[masks[current]]:
+                neighbor = current + offset
+                if not seen[neighbor]:
+                    seen[neighbor] = 1
+                    parent[neighbor] = current
+                    push(neighbor)
+                    visited.append(neighbor)
 
-            if current == self.end_pos:
-                self.solution_path = self.reconstruct_path(came_from)
-                self.path_length = len(self.solution_path)
-                return True
+        self.nodes_expanded += expanded
+        self.__finish([], visited)
+        return False
 
-            for neighbor in self.get_neighbors(current[0], current[1]):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    came_from[neighbor] = current
-                    queue.append(neighbor)
+    def __best_first_search(self, use_heuristic: bool, pause_every: int = 0) -> Generator[int, None, bool]:
+        """UCS (cost only) or A* (cost + Manhattan distance) over flat indices"""
+        start, goal = self.__endpoints()
+        (state,), (parent,), cost = self.__search_buffers()
+        adjacency = self.adjacency or self.refresh_adjacency()
+        masks, offsets = adjacency.masks, adjacency.offsets
+        width = self.maze_width
+        goal_x, goal_y = self.end_pos
+        visited = []
+
+        # state: 0 = unseen, 1 = has a tentative cost, 2 = closed
+        state[start] = 1
+        cost[start] = 0
+        parent[start] = -1
+        heap = [(0, 0, start)]
+        expanded = 0
+        pause_at = pause_every or -1
 
-                    if neighbor != self.end_pos:
-                        self.maze_grid[neighbor[1]][neighbor[0]].status = 5
+        while heap:
+            _, current_cost, current = heapq.heappop(heap)
 
-                    self.visited_cells.append(neighbor)
+            if state[current] == 2:
+                continue
 
-        return False
+            state[current] = 2
+            expanded += 1
+            if expanded == pause_at:
+                pause_at += pause_every
+                yield pause_every
 
-    def DFS(self) -> bool:
-        """Depth-First Search - Find a path (not necessarily shortest)"""
-        if not self.start_pos or not self.end_pos:
-            return False
+            if current == goal:
+                self.nodes_expanded += expanded
+                self.__finish(self.__trace(parent, goal), visited)
+                return True
 
-        stack = [self.start_pos]
-        visited = {self.start_pos}
-        came_from = {self.start_pos: None}
+            new_cost = current_cost + 1
+            for offset in offsets[masks[current]]:
+                neighbor = current + offset
+                seen = state[neighbor]
+                if seen != 2 and (seen == 0 or new_cost < cost[neighbor]):
+                    state[neighbor] = 1
+                    cost[neighbor] = new_cost
+                    parent[neighbor] = current
+                    if use_heuristic:
+                        y, x = divmod(neighbor, width)
+                        priority = new_cost + abs(x - goal_x) + abs(y - goal_y)
+                    else:
+                        priority = new_cost
+                    heapq.heappush(heap, (priority, new_cost, neighbor))
+                    visited.append(neighbor)
 
-        while stack:
-            current = stack.pop()
-            self.nodes_expanded += 1
+        self.nodes_expanded += expanded
+        self.__finish([], visited)
+        return False
 
-            if current == self.end_pos:
-                self.solution_path = self.reconstruct_path(came_from)
-                self.path_length = len(self.solution_path)
+    # ---- Junction-graph search
+    # Corridors are contracted (Model/junction_graph.py): these searches only
+    # expand dead ends, junctions and the two endpoints, and walk just the
+    # corridors of the path they return. visited_cells lists the nodes reached.
+
+    def __junction_search(self, algorithm: str, pause_every: int = 0) -> Generator[int, None, bool]:
+        """BFS, DFS, UCS or A* over the maze's junction graph"""
+        start, goal = self.__endpoints()
+        # Built (once per maze) in slices too, so a first search does not stall
+        graph = yield from junction_graph_steps(self.adjacency or self.refresh_adjacency(), pause_every)
+        node_edges, extra = graph.edges, graph.query_edges(start, goal)
+        width = self.maze_width
+        goal_x, goal_y = self.end_pos
+        came = {start: None}  # node -> (previous node, offset of its corridor's first step)
+        cost = {start: 0}
+        closed = set()
+        visited = []
+        expanded = 0
+        work = 0  # Pause budget spent: one per node plus one per corridor it relaxes
+        pause_at = pause_every or -1
+
+        # Frontier: a stack for DFS, distance buckets for BFS (so nodes are
+        # still expanded in BFS order although corridors have lengths), and a
+        # heap for UCS / A*
+        depth_first = algorithm == "DFS"
+        breadth_first = algorithm == "BFS"
+        use_heuristic = algorithm == "A*"
+        stack = [start]
+        buckets = {0: [start]}
+        heap = [(0, 0, start)]
+        level = 0
+
+        while True:
+            if depth_first:
+                if not stack:
+                    break
+                current = stack.pop()
+            else:
+                if breadth_first:
+                    if not buckets:
+                        break
+                    while level not in buckets:
+                        level += 1
+                    bucket = buckets[level]
+                    current = bucket.pop()
+                    if not bucket:
+                        del buckets[level]
+                else:
+                    if not heap:
+                        break
+                    current = heapq.heappop(heap)[2]
+                if current in closed:
+                    continue
+                closed.add(current)
+
+            expanded += 1
+            if current == goal:
+                self.nodes_expanded += expanded
+                self.__finish(self.__expand_path(graph, came, goal), visited)
                 return True
 
-            for neighbor in self.get_neighbors(current[0], current[1]):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    came_from[neighbor] = current
+            edges = extra.get(current)
+            if edges is None:
+                edges = node_edges.get(current, ())
+            # A node costs about one cell expansion per corridor it relaxes,
+            # so count those too and keep slices as short as the cell searches'
+            work += 1 + len(edges)
+            if work >= pause_at > 0:
+                pause_at = work + pause_every
+                yield pause_every
+
+            base = 0 if depth_first else cost[current]
+            for neighbor, length, offset in edges:
+                if depth_first:
+                    if neighbor in came:
+                        continue
+                    came[neighbor] = (current, offset)
                     stack.append(neighbor)
+                else:
+                    new_cost = base + length
+                    if neighbor in closed or neighbor in cost and new_cost >= cost[neighbor]:
+                        continue
+                    cost[neighbor] = new_cost
+                    came[neighbor] = (current, offset)
+                    if breadth_first:
+                        bucket = buckets.get(new_cost)
+                        if bucket is None:
+                            buckets[new_cost] = [neighbor]
+                        else:
+                            bucket.append(neighbor)
+                    else:
+                        priority = new_cost
+                        if use_heuristic:
+                            y, x = divmod(neighbor, width)
+                            priority += abs(x - goal_x) + abs(y - goal_y)
+                        heapq.heappush(heap, (priority, new_cost, neighbor))
+                visited.append(neighbor)
+
+        self.nodes_expanded += expanded
+        self.__finish([], visited)
+        return False
 
-                    if neighbor != self.end_pos:
-                        self.maze_grid[neighbor[1]][neighbor[0]].status = 5
+    @staticmethod
+    def __expand_path(graph: JunctionGraph, came: dict, goal: int) -> List[int]:
+        """Cell indices of the node path ending at goal, corridors included"""
+        hops = []
+        node = goal
+        while came[node] is not None:
+            previous, offset = came[node]
+            hops.append((previous, offset, node))
+            node = previous
+        path = [node]
+        for previous, offset, node in reversed(hops):
+            path.extend(graph.expand(previous, offset, node))
+        return path
 
-                    self.visited_cells.append(neighbor)
+    def __search(self, algorithm: str, pause_every: int = 0) -> Generator[int, None, bool]:
+        """Resumable search for algorithm (junction graph or per-cell)"""
+        # Bidirectional stays per-cell: its level-synchronous BFS meets the
+        # two sides on discovery, which is only shortest with unit-length
+        # edges; junction-graph edges are corridors of any length
+        if self.contract_corridors and algorithm in ("BFS", "DFS", "UCS", "A*"):
+            return self.__junction_search(algorithm, pause_every)
+        elif algorithm == "BFS":
+            return self.__first_search(True, pause_every)
+        elif algorithm == "DFS":
+            return self.__first_search(False, pause_every)
+        elif algorithm == "UCS":
+            return self.__best_first_search(False, pause_every)
+        elif algorithm == "A*":
+            return self.__best_first_search(True, pause_every)
+        elif algorithm == "Bidirectional":
+            return self.__bidirectional_search(pause_every)
+        raise ValueError(f"Unknown algorithm: {algorithm}")
 
-        return False
+    def BFS(self) -> bool:
+        """Breadth-First Search - Find shortest path"""
+        if not self.start_pos or not self.end_pos:
+            return False
+        return run_steps(self.__search("BFS"))
+
+    def DFS(self) -> bool:
+        """Depth-First Search - Find a path (not necessarily shortest)"""
+        if not self.start_pos or not self.end_pos:
+            return False
+        return run_steps(self.__search("DFS"))
 
     def UCS(self) -> bool:
         """Uniform Cost Search - Find path with lowest cost"""
         if not self.start_pos or not self.end_pos:
             return False
-
-        heap = [(0, self.start_pos)]
-        visited = set()
-        came_from = {self.start_pos: None}
-        cost_so_far = {self.start_pos: 0}
-
-        while heap:
-            current_cost, current = heapq.heappop(heap)
-
-            if current in visited:
-                continue
-
-            visited.add(current)
-            self.nodes_expanded += 1
-
-            if current == self.end_pos:
-                self.solution_path = self.reconstruct_path(came_from)
-                self.path_length = len(self.solution_path)
-                return True
-
-            for neighbor in self.get_neighbors(current[0], current[1]):
-                new_cost = current_cost + 1
-
-                if neighbor not in visited and (neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]):
-                    cost_so_far[neighbor] = new_cost
-                    came_from[neighbor] = current
-                    heapq.heappush(heap, (new_cost, neighbor))
-
-                    if neighbor != self.end_pos:
-                        self.maze_grid[neighbor[1]][neighbor[0]].status = 5
-
-                    self.visited_cells.append(neighbor)
-
-        return False
+        return run_steps(self.__search("UCS"))
 
     def A_star(self) -> bool:
         """A* Search - Find optimal path with heuristic"""
         if not self.start_pos or not self.end_pos:
             return False
-
-        heap = [(0, 0, self.start_pos)]
-        visited = set()
-        came_from = {self.start_pos: None}
-        g_score = {self.start_pos: 0}
-
-        while heap:
-            f_score, g_score_current, current = heapq.heappop(heap)
-
-            if current in visited:
-                continue
-
-            visited.add(current)
-            self.nodes_expanded += 1
-
-            if current == self.end_pos:
-                self.solution_path = self.reconstruct_path(came_from)
-                self.path_length = len(self.solution_path)
-                return True
-
-            for neighbor in self.get_neighbors(current[0], current[1]):
-                tentative_g_score = g_score_current + 1
-
-                if neighbor not in visited and (neighbor not in g_score or tentative_g_score < g_score[neighbor]):
-                    g_score[neighbor] = tentative_g_score
-                    f_score = tentative_g_score + self.heuristic(neighbor, self.end_pos)
-                    came_from[neighbor] = current
-                    heapq.heappush(heap, (f_score, tentative_g_score, neighbor))
-
-                    if neighbor != self.end_pos:
-                        self.maze_grid[neighbor[1]][neighbor[0]].status = 5
-
-                    self.visited_cells.append(neighbor)
-
-        return False
+        return run_steps(self.__search("A*"))
 
     def Bidirectional_Search(self) -> bool:
         """Bidirectional Search - Search from both ends"""
         if not self.start_pos or not self.end_pos:
             return False
-
-        # Initialize search from start
-        queue_start = deque([self.start_pos])
-        visited_start = {self.start_pos}
-        came_from_start = {self.start_pos: None}
-
-        # Initialize search from end
-        queue_end = deque([self.end_pos])
-        visited_end = {self.end_pos}
-        came_from_end = {self.end_pos: None}
-
-        while queue_start or queue_end:
-            # Search from start
-            if queue_start:
-                current_start = queue_start.popleft()
-                self.nodes_expanded += 1
-
-                if current_start in visited_end:
-                    # Reconstruct path
-                    path_start = []
-                    node = current_start
-                    while node is not None:
-                        path_start.append(node)
-                        node = came_from_start.get(node)
-                    path_start.reverse()
-
-                    path_end = []
-                    node = came_from_end[current_start]
-                    while node is not None:
-                        path_end.append(node)
-                        node = came_from_end.get(node)
-
-                    self.solution_path = path_start + path_end
-                    self.path_length = len(self.solution_path)
-                    return True
-
-                for neighbor in self.get_neighbors(current_start[0], current_start[1]):
-                    if neighbor not in visited_start:
-                        visited_start.add(neighbor)
-                        came_from_start[neighbor] = current_start
-                        queue_start.append(neighbor)
-
-                        if neighbor not in [self.start_pos, self.end_pos]:
-                            self.maze_grid[neighbor[1]][neighbor[0]].status = 5
-
-                        self.visited_cells.append(neighbor)
-
-            # Search from end
-            if queue_end:
-                current_end = queue_end.popleft()
-                self.nodes_expanded += 1
-
-                if current_end in visited_start:
-                    # Reconstruct path
-                    path_start = []
-                    node = current_end
-                    while node is not None:
-                        path_start.append(node)
-                        node = came_from_start.get(node)
-                    path_start.reverse()
-
-                    path_end = []
-                    node = came_from_end[current_end]
-                    while node is not None:
-                        path_end.append(node)
-                        node = came_from_end.get(node)
-
-                    self.solution_path = path_start + path_end
-                    self.path_length = len(self.solution_path)
-                    return True
-
-                for neighbor in self.get_neighbors(current_end[0], current_end[1]):
-                    if neighbor not in visited_end:
-                        visited_end.add(neighbor)
-                        came_from_end[neighbor] = current_end
-                        queue_end.append(neighbor)
-
-                        if neighbor not in [self.start_pos, self.end_pos]:
-                            self.maze_grid[neighbor[1]][neighbor[0]].status = 5
-
-                        self.visited_cells.append(neighbor)
-
+        return run_steps(self.__bidirectional_search())
+
+    def __bidirectional_search(self, pause_every: int = 0) -> Generator[int, None, bool]:
+        """
+        Level-synchronous BFS from both ends over flat indices
+        Each round expands one whole level of the smaller frontier; the
+        searches meet when one side discovers a cell the other has seen
+        """
+        start, goal = self.__endpoints()
+        (seen_start, seen_end), (parent_start, parent_end), _ = self.__search_buffers(2)
+        adjacency = self.adjacency or self.refresh_adjacency()
+        masks, offsets = adjacency.masks, adjacency.offsets
+        visited = []
+        expanded = 0
+        pause_at = pause_every or -1
+
+        if start == goal:
+            self.__finish([start], visited)
+            return True
+
+        seen_start[start] = 1
+        parent_start[start] = -1
+        seen_end[goal] = 1
+        parent_end[goal] = -1
+        frontier_start = [start]
+        frontier_end = [goal]
+
+        while frontier_start and frontier_end:
+            forward = len(frontier_start) <= len(frontier_end)
+            if forward:
+                frontier, seen, parent, seen_other = frontier_start, seen_start, parent_start, seen_end
+            else:
+                frontier, seen, parent, seen_other = frontier_end, seen_end, parent_end, seen_start
+
+            next_level = []
+            for current in frontier:
+                expanded += 1
+                if expanded == pause_at:
+                    pause_at += pause_every
+                    yield pause_every
+
+                for offset in offsets[masks[current]]:
+                    neighbor = current + offset
+                    if seen[neighbor]:
+                        continue
+                    parent[neighbor] = current
+                    visited.append(neighbor)
+
+                    if seen_other[neighbor]:
+                        # Every cell the other side has seen but not expanded is on
+                        # its newest level, so the first meeting is a shortest path
+                        self.nodes_expanded += expanded
+                        path = self.__trace(parent_start, neighbor)
+                        node = parent_end[neighbor]
+                        while node >= 0:
+                            path.append(node)
+                            node = parent_end[node]
+                        self.__finish(path, visited)
+                        return True
+
+                    seen[neighbor] = 1
+                    next_level.append(neighbor)
+
+            if forward:
+                frontier_start = next_level
+            else:
+                frontier_end = next_level
+
+        self.nodes_expanded += expanded
+        self.__finish([], visited)
         return False
 
     def solve_maze(self, algorithm: str) -> bool:
         """Solve maze using selected algorithm"""
+        return run_steps(self.solve_steps(algorithm))
+
+    def solve_steps(self, algorithm: str, pause_every: int = 0) -> Generator[int, None, bool]:
+        """
+        Resumable solve_maze: pauses (yielding pause_every) after every
+        pause_every node expansions and returns the found flag when done
+        pause_every = 0 never pauses
+        """
         if not self.start_pos or not self.end_pos:
             return False
 
         self.algorithm = algorithm
         self.reset_solving_state()
+        self.refresh_adjacency()
 
         start_time = time.time()
 
-        if algorithm == "BFS":
-            self.solution_found = self.BFS()
-        elif algorithm == "DFS":
-            self.solution_found = self.DFS()
-        elif algorithm == "UCS":
-            self.solution_found = self.UCS()
-        elif algorithm == "A*":
-            self.solution_found = self.A_star()
-        elif algorithm == "Bidirectional":
-            self.solution_found = self.Bidirectional_Search()
-        else:
-            raise ValueError(f"Unknown algorithm: {algorithm}")
+        self.solution_found = yield from self.__search(algorithm, pause_every)
 
         self.solving_time = time.time() - start_time
         self.solving_complete = True
 
-        # Mark found path
-        if self.solution_found:
-            for pos in self.solution_path:
-                if pos not in [self.start_pos, self.end_pos]:
-                    self.maze_grid[pos[1]][pos[0]].status = 4  # Path Found
+        if self.path_buffer is not None:
+            self.path_buffer.write(self.solution_path)
 
         return self.solution_found
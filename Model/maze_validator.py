@@ -0,0 +1,130 @@
+"""
+Maze Validator
+Checks a generated maze before it is handed to the player: connected
+components, cycles, and whether start, goal and collectibles can be reached.
+
+Open cells are grouped into horizontal runs first (found with a regex over
+each row), so union-find only links runs, never individual cells of a run.
+The whole check is a single pass and stays near-linear on million-cell grids.
+"""
+import re
+from array import array
+from typing import Iterable, List, Optional, Tuple
+from Model.disjoint_set import DisjointSet
+
+# Maximal runs of non-wall cells in a row
+_OPEN_RUN = re.compile(rb'[^\x00]+')
+
+
+class MazeReport:
+    """Result of validate_maze()"""
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.open_cells = 0
+        self.links = 0  # Pairs of adjacent open cells
+        self.components = 0
+        self.problems: List[str] = []
+        self._labels: Optional[array] = None  # Run label per cell (-1 = wall)
+        self._runs: Optional[DisjointSet] = None
+        self._start_root = -1
+
+    @property
+    def cycles(self) -> int:
+        """Number of independent cycles (0 for a tree)"""
+        return self.links - self.open_cells + self.components
+
+    @property
+    def is_perfect(self) -> bool:
+        """Exactly one path between any two open cells"""
+        return self.components == 1 and self.cycles == 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.problems
+
+    def component_of(self, pos: Tuple[int, int]) -> int:
+        """Component id of an open cell, or -1 for walls and out-of-range cells"""
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return -1
+        label = self._labels[y * self.width + x]
+        return -1 if label < 0 else self._runs.find(label)
+
+    def reachable(self, pos: Tuple[int, int]) -> bool:
+        """Whether pos can be reached from the start"""
+        return self._start_root >= 0 and self.component_of(pos) == self._start_root
+
+    def __repr__(self) -> str:
+        state = "ok" if self.ok else "; ".join(self.problems)
+        return (f"MazeReport({self.width}x{self.height}, components={self.components}, "
+                f"cycles={self.cycles}, {state})")
+
+
+def validate_maze(grid, start: Tuple[int, int], goal: Tuple[int, int],
+                  collectibles: Iterable[Tuple[int, int]] = (),
+                  require_perfect: bool = True) -> MazeReport:
+    """
+    Validate grid (MazeGrid or anything with width, height and cells)
+    Problems are collected in report.problems; report.ok is True if none
+    """
+    width, height = grid.width, grid.height
+    cells = bytes(grid.cells)
+    report = MazeReport(width, height)
+
+    # Label horizontal runs; links inside a run are implicit
+    labels = array('i', [-1]) * (width * height)
+    run_bounds = []  # (start index, end index) per run
+    links = open_cells = 0
+    for y in range(height):
+        offset = y * width
+        for match in _OPEN_RUN.finditer(cells, offset, offset + width):
+            begin, end = match.span()
+            label = len(run_bounds)
+            run_bounds.append((begin, end))
+            labels[begin:end] = array('i', [label]) * (end - begin)
+            open_cells += end - begin
+            links += end - begin - 1
+
+    # Link each run to the runs directly below it: every open stretch under
+    # a run belongs to a single run of the next row
+    runs = DisjointSet(len(run_bounds))
+    union = runs.union
+    finditer = _OPEN_RUN.finditer
+    limit = width * (height - 1)
+    for label, (begin, end) in enumerate(run_bounds):
+        if begin >= limit:
+            break
+        for match in finditer(cells, begin + width, end + width):
+            below_begin, below_end = match.span()
+            links += below_end - below_begin
+            union(label, labels[below_begin])
+
+    report.open_cells = open_cells
+    report.links = links
+    report.components = runs.count
+    report._labels = labels
+    report._runs = runs
+
+    # Markers left by generation must agree with the expected start/goal
+    for status, name, expected in ((2, "Start", start), (3, "End", goal)):
+        index = cells.find(bytes([status]))
+        if index >= 0 and (index % width, index // width) != tuple(expected):
+            report.problems.append(f"{name} marker at {(index % width, index // width)}, expected {tuple(expected)}")
+
+    report._start_root = report.component_of(start)
+    if report._start_root < 0:
+        report.problems.append(f"start {tuple(start)} is not an open cell")
+    elif not report.reachable(goal):
+        report.problems.append(f"goal {tuple(goal)} is not reachable from start")
+    for item in collectibles:
+        if report._start_root >= 0 and not report.reachable(item):
+            report.problems.append(f"collectible {tuple(item)} is not reachable from start")
+
+    if require_perfect:
+        if report.components != 1:
+            report.problems.append(f"{report.components} connected components")
+        if report.cycles:
+            report.problems.append(f"{report.cycles} cycles")
+    return report
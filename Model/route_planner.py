@@ -0,0 +1,179 @@
+"""
+Route Planner
+Contains RoutePlanner, a per-maze session that builds the whole auto-solve
+route in one call: start -> every collectible (in tour order) -> goal.
+
+The session keeps one SolvingModel, so its search buffers are allocated once,
+takes the visiting order from the maze's DistanceField, and caches every leg
+by its endpoints and algorithm, so planning again on the same maze only
+searches legs it has not seen. DFS does not return shortest paths, which the
+step budget relies on, so unless the maze is perfect (every path is then the
+shortest one) DFS legs are searched with BFS and labelled as such.
+
+A PlanningJob does the same work in slices: advance() runs a bounded number
+of node expansions, so a game can plan a frame at a time and start walking
+as soon as the first leg is found.
+"""
+from typing import Dict, Generator, List, Optional, Sequence, Tuple
+from Model.distance_field import DistanceField, get_distance_field
+from Model.maze_solver import SolvingModel, run_steps
+from Model.tour_planner import EXACT_LIMIT, plan_tour
+
+# Algorithms whose paths are shortest paths; the others fall back to BFS
+# on mazes with loops
+SHORTEST_PATH_ALGORITHMS = ("BFS", "UCS", "A*", "Bidirectional")
+FALLBACK_ALGORITHM = "BFS"
+
+# Node expansions between two pauses of a PlanningJob's searches
+PLAN_SLICE = 1000
+
+
+class Leg:
+    """Path between two consecutive stops and the algorithm that found it"""
+    __slots__ = ('start', 'end', 'path', 'algorithm')
+
+    def __init__(self, start: Tuple[int, int], end: Tuple[int, int],
+                 path: List[Tuple[int, int]], algorithm: str):
+        self.start = start
+        self.end = end
+        self.path = path
+        self.algorithm = algorithm
+
+    def __len__(self) -> int:
+        """Number of moves along the leg"""
+        return len(self.path) - 1
+
+
+class Route:
+    """Legs of a planned route, in walking order"""
+
+    def __init__(self, requested: str, legs: List[Leg]):
+        self.requested = requested
+        self.legs = legs
+
+    @property
+    def path(self) -> List[Tuple[int, int]]:
+        """Every cell of the route, each leg joined at its shared stop"""
+        path = list(self.legs[0].path) if self.legs else []
+        for leg in self.legs[1:]:
+            path.extend(leg.path[1:])
+        return path
+
+    @property
+    def length(self) -> int:
+        """Number of moves along the route"""
+        return sum(len(leg) for leg in self.legs)
+
+    @property
+    def label(self) -> str:
+        """Requested algorithm, plus the one actually used if legs fell back"""
+        used = sorted({leg.algorithm for leg in self.legs} - {self.requested})
+        return f"{self.requested} → {', '.join(used)}" if used else self.requested
+
+
+class RoutePlanner:
+    """Route planning session for one maze"""
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.field: DistanceField = get_distance_field(grid)
+        self.solver = SolvingModel(grid, grid.width, grid.height)
+        self.legs: Dict[tuple, Leg] = {}  # (start, end, algorithm) -> Leg
+
+    def matches(self, grid) -> bool:
+        """Whether this session can still plan on grid"""
+        return grid is self.grid and self.field.matches(grid)
+
+    def leg_algorithm(self, algorithm: Optional[str]) -> str:
+        """Algorithm used for legs when algorithm is requested"""
+        if algorithm in SHORTEST_PATH_ALGORITHMS:
+            return algorithm
+        # On a perfect maze any search finds the single, shortest path
+        if algorithm is not None and self.field.tree is not None:
+            return algorithm
+        return FALLBACK_ALGORITHM
+
+    def leg(self, start: Tuple[int, int], end: Tuple[int, int], algorithm: Optional[str]) -> Optional[Leg]:
+        """Leg from start to end (cached), or None if end cannot be reached"""
+        return run_steps(self.leg_steps(start, end, algorithm))
+
+    def leg_steps(self, start: Tuple[int, int], end: Tuple[int, int], algorithm: Optional[str],
+                  pause_every: int = 0) -> Generator[int, None, Optional[Leg]]:
+        """Resumable leg(): the search pauses every pause_every node expansions"""
+        start, end = tuple(start), tuple(end)
+        used = self.leg_algorithm(algorithm)
+        key = (start, end, used)
+        leg = self.legs.get(key)
+        if leg is None:
+            solver = self.solver
+            solver.start_pos = start
+            solver.end_pos = end
+            if not (yield from solver.solve_steps(used, pause_every)):
+                return None
+            leg = self.legs[key] = Leg(start, end, list(solver.solution_path), used)
+        return leg
+
+    def plan(self, start: Tuple[int, int], goal: Tuple[int, int],
+             collectibles: Sequence[Tuple[int, int]], algorithm: Optional[str],
+             exact_limit: int = EXACT_LIMIT) -> Optional[Route]:
+        """Route from start through every collectible to goal, or None if a stop is unreachable"""
+        job = PlanningJob(self, start, goal, collectibles, algorithm, exact_limit, pause_every=0)
+        job.advance()
+        return job.route
+
+
+class PlanningJob:
+    """
+    RoutePlanner.plan() in resumable slices
+    Legs are appended to legs in walking order as soon as each is found;
+    route is set once done (None if failed)
+    """
+
+    def __init__(self, planner: RoutePlanner, start: Tuple[int, int], goal: Tuple[int, int],
+                 collectibles: Sequence[Tuple[int, int]], algorithm: Optional[str],
+                 exact_limit: int = EXACT_LIMIT, pause_every: int = PLAN_SLICE):
+        self.planner = planner
+        self.requested = algorithm or FALLBACK_ALGORITHM
+        self.legs: List[Leg] = []
+        self.route: Optional[Route] = None
+        self.done = False
+        self.failed = False
+        self._steps = self.__run(tuple(start), tuple(goal), [tuple(p) for p in collectibles],
+                                 algorithm, exact_limit, pause_every)
+
+    @property
+    def path(self) -> List[Tuple[int, int]]:
+        """Cells of the legs found so far"""
+        return Route(self.requested, self.legs).path
+
+    def advance(self, budget: Optional[int] = None) -> bool:
+        """Run about budget node expansions (None = to the end); True once the job is done"""
+        spent = 0
+        while not self.done and (budget is None or spent < budget):
+            try:
+                spent += next(self._steps)
+            except StopIteration as finished:
+                self.done = True
+                self.route = finished.value
+                self.failed = self.route is None
+        return self.done
+
+    def __run(self, start, goal, collectibles, algorithm, exact_limit, pause_every):
+        planner = self.planner
+        # Tree index on a perfect maze, otherwise one BFS per stop (both
+        # time-sliced); the tour itself is then only lookups
+        tree = yield from planner.field.tree_steps(pause_every)
+        if tree is None:
+            for pos in [start] + collectibles:
+                yield from planner.field.add_steps(pos, pause_every)
+        _, order = plan_tour(planner.field, start, goal, collectibles, exact_limit)
+        if collectibles and not order:
+            return None
+
+        stops = [start] + order + [goal]
+        for here, there in zip(stops, stops[1:]):
+            leg = yield from planner.leg_steps(here, there, algorithm, pause_every)
+            if leg is None:
+                return None
+            self.legs.append(leg)
+        return Route(self.requested, list(self.legs))
@@ -0,0 +1,159 @@
+"""
+Shared Memory Grids
+Contains SharedMazeGrid and SharedPathBuffer, maze cells and solution paths
+stored in multiprocessing.shared_memory blocks.
+
+A worker process attaches to a block by name and writes into it directly,
+so results reach the main process without pickling. Each block starts with
+a small header, so attaching needs only the block name.
+"""
+import struct
+from array import array
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+from Model.maze_grid import MazeGrid
+
+_GRID_MAGIC = b'MZG1'
+_GRID_HEADER = struct.Struct('<4sII')  # magic, width, height
+_PATH_MAGIC = b'MZP1'
+_PATH_HEADER = struct.Struct('<4sII')  # magic, capacity, length
+
+
+class SharedMazeGrid(MazeGrid):
+    """
+    MazeGrid whose cells live in a shared memory block
+    create() makes a new block (the creator should unlink() it when done);
+    attach() opens an existing one by name in any process
+    """
+    __slots__ = ('shm', 'owner')
+
+    @classmethod
+    def create(cls, width: int, height: int, fill: int = 0, name: Optional[str] = None) -> 'SharedMazeGrid':
+        shm = shared_memory.SharedMemory(name=name, create=True, size=_GRID_HEADER.size + width * height)
+        _GRID_HEADER.pack_into(shm.buf, 0, _GRID_MAGIC, width, height)
+        grid = cls._from_block(shm, width, height, owner=True)
+        grid.fill(fill)
+        return grid
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedMazeGrid':
+        shm = shared_memory.SharedMemory(name=name)
+        magic, width, height = _GRID_HEADER.unpack_from(shm.buf)
+        if magic != _GRID_MAGIC:
+            shm.close()
+            raise ValueError(f"Shared memory block {name} is not a maze grid")
+        return cls._from_block(shm, width, height, owner=False)
+
+    @classmethod
+    def _from_block(cls, shm: shared_memory.SharedMemory, width: int, height: int,
+                    owner: bool) -> 'SharedMazeGrid':
+        grid = cls.__new__(cls)
+        grid.width = width
+        grid.height = height
+        grid.cells = shm.buf[_GRID_HEADER.size:_GRID_HEADER.size + width * height]
+        grid.shm = shm
+        grid.owner = owner
+        grid._adjacency = None
+        grid._distances = None
+        return grid
+
+    @property
+    def name(self) -> str:
+        """Block name to pass to attach() in another process"""
+        return self.shm.name
+
+    def close(self):
+        """Detach from the block (the grid can no longer be used)"""
+        if self.shm is None:
+            return
+        self.cells.release()
+        self.shm.close()
+        self.shm = None
+
+    def unlink(self):
+        """Close and free the block; only the creator should call this"""
+        shm = self.shm
+        self.close()
+        if shm is not None and self.owner:
+            shm.unlink()
+
+    def __enter__(self) -> 'SharedMazeGrid':
+        return self
+
+    def __exit__(self, *exc):
+        if self.owner:
+            self.unlink()
+        else:
+            self.close()
+
+
+class SharedPathBuffer:
+    """Fixed-capacity list of (x, y) positions in a shared memory block"""
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self.shm = shm
+        self.owner = owner
+        magic, self.capacity, _ = _PATH_HEADER.unpack_from(shm.buf)
+        if magic != _PATH_MAGIC:
+            raise ValueError(f"Shared memory block {shm.name} is not a path buffer")
+        self._coords = shm.buf[_PATH_HEADER.size:_PATH_HEADER.size + 8 * self.capacity].cast('I')
+
+    @classmethod
+    def create(cls, capacity: int, name: Optional[str] = None) -> 'SharedPathBuffer':
+        """Buffer for up to capacity positions (a maze's cell count always suffices)"""
+        shm = shared_memory.SharedMemory(name=name, create=True, size=_PATH_HEADER.size + 8 * max(capacity, 1))
+        _PATH_HEADER.pack_into(shm.buf, 0, _PATH_MAGIC, capacity, 0)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedPathBuffer':
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            return cls(shm, owner=False)
+        except ValueError:
+            shm.close()
+            raise
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def write(self, path: List[Tuple[int, int]]):
+        """Store path, replacing the previous contents"""
+        if len(path) > self.capacity:
+            raise ValueError("path longer than the shared buffer")
+        coords = array('I', [c for pos in path for c in pos])
+        self._coords[:len(coords)] = coords
+        _PATH_HEADER.pack_into(self.shm.buf, 0, _PATH_MAGIC, self.capacity, len(path))
+
+    def read(self) -> List[Tuple[int, int]]:
+        """Current contents as a list of (x, y)"""
+        _, _, length = _PATH_HEADER.unpack_from(self.shm.buf)
+        coords = self._coords[:2 * length].tolist()
+        return list(zip(coords[0::2], coords[1::2]))
+
+    def __len__(self) -> int:
+        return _PATH_HEADER.unpack_from(self.shm.buf)[2]
+
+    def close(self):
+        if self.shm is None:
+            return
+        self._coords.release()
+        self.shm.close()
+        self.shm = None
+
+    def unlink(self):
+        """Close and free the block; only the creator should call this"""
+        shm = self.shm
+        self.close()
+        if shm is not None and self.owner:
+            shm.unlink()
+
+    def __enter__(self) -> 'SharedPathBuffer':
+        return self
+
+    def __exit__(self, *exc):
+        if self.owner:
+            self.unlink()
+        else:
+            self.close()
@@ -0,0 +1,91 @@
+"""
+Generation Step Log
+Contains StepLog, a compact record of (x, y, action) generation steps.
+
+Each step is packed into one unsigned 32-bit int: the flat cell index
+(y * width + x) shifted left by two bits, plus a 2-bit action code.
+"""
+import struct
+import sys
+from array import array
+from typing import Iterable, Iterator, Tuple, Union
+
+ACTIONS = ('path', 'break_wall', 'build_wall')
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+
+# Largest flat cell index that still fits next to the 2-bit action code
+MAX_CELL_INDEX = (1 << 30) - 1
+
+_TYPECODE = 'I' if array('I').itemsize == 4 else 'L'
+_HEADER = struct.Struct('<4sIII')  # magic, width, height, step count
+_MAGIC = b'MZS1'
+
+
+class StepLog:
+    """Packed, random-access list of generation steps"""
+
+    def __init__(self, width: int, height: int, steps: Iterable[Tuple[int, int, str]] = ()):
+        self.width = width
+        self.height = height
+        self.data = array(_TYPECODE)
+        self.extend(steps)
+
+    def encode(self, x: int, y: int, action: str) -> int:
+        """Pack one step into an int"""
+        index = y * self.width + x
+        if index > MAX_CELL_INDEX:
+            raise ValueError("maze too large for a packed step log")
+        return (index << 2) | ACTION_CODES[action]
+
+    def decode(self, value: int) -> Tuple[int, int, str]:
+        """Unpack an int back into (x, y, action)"""
+        y, x = divmod(value >> 2, self.width)
+        return (x, y, ACTIONS[value & 3])
+
+    def append(self, step: Tuple[int, int, str]):
+        self.data.append(self.encode(*step))
+
+    def extend(self, steps: Iterable[Tuple[int, int, str]]):
+        encode = self.encode
+        self.data.extend(encode(x, y, action) for x, y, action in steps)
+
+    def clear(self):
+        del self.data[:]
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            log = StepLog(self.width, self.height)
+            log.data = self.data[index]
+            return log
+        return self.decode(self.data[index])
+
+    def __iter__(self) -> Iterator[Tuple[int, int, str]]:
+        decode = self.decode
+        for value in self.data:
+            yield decode(value)
+
+    def save(self, path: str):
+        """Write the log to disk (little-endian header followed by the packed steps)"""
+        data = self.data
+        if sys.byteorder != 'little':
+            data = array(_TYPECODE, data)
+            data.byteswap()
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, self.width, self.height, len(data)))
+            data.tofile(f)
+
+    @classmethod
+    def load(cls, path: str) -> 'StepLog':
+        """Read a log written by save()"""
+        with open(path, 'rb') as f:
+            magic, width, height, count = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"Not a step log file: {path}")
+            log = cls(width, height)
+            log.data.fromfile(f, count)
+        if sys.byteorder != 'little':
+            log.data.byteswap()
+        return log
@@ -0,0 +1,128 @@
+"""
+Stitched Maze Generation
+Builds one huge perfect maze on several cores.
+
+The cell lattice is cut into rectangular regions. Each region is generated
+as an independent maze by a worker process (any GenerationModel algorithm),
+which writes its interior straight into a shared memory grid. The regions
+are then joined along a random spanning tree of the region graph, opening
+exactly one wall cell per tree edge, so the result is still perfect: every
+region is a tree, and the region tree adds exactly one link per join.
+"""
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+from Model.maze_grid import MazeGrid
+from Model.disjoint_set import DisjointSet
+from Model.shared_grid import SharedMazeGrid
+
+# Default region side, in lattice cells (a 512x512 region is a 1025x1025 maze)
+REGION_CELLS = 512
+
+# (lattice x, lattice y, lattice width, lattice height) of one region
+Region = Tuple[int, int, int, int]
+
+# Cell status -> 0 (wall) / 1 (path); drops each region's own Start/End markers
+_PATH_ONLY = b'\x00' + b'\x01' * 255
+
+
+def split_lattice(cols: int, rows: int, region_cells: int) -> Tuple[List[int], List[int]]:
+    """Start offsets of the region columns and rows covering a cols x rows lattice"""
+    return list(range(0, cols, region_cells)), list(range(0, rows, region_cells))
+
+
+def _generate_region(job: Tuple[str, Region, str, int]):
+    """Worker: generate one region and copy its interior (walls and paths only) into the shared grid"""
+    from Model.maze_generator import GenerationModel  # maze_generator imports this module
+
+    grid_name, (ox, oy, rc, rr), algorithm, seed = job
+    local_w = 2 * rc + 1
+    model = GenerationModel(local_w, 2 * rr + 1, algorithm, seed=seed)
+    model.generate_maze()
+    cells = model.Maze.cells
+
+    grid = SharedMazeGrid.attach(grid_name)
+    try:
+        # Local (1, 1) lands on global (2 * ox + 1, 2 * oy + 1); the local
+        # border walls coincide with the shared walls between regions
+        for y in range(1, 2 * rr):
+            src = y * local_w + 1
+            dst = grid.index(2 * ox + 1, 2 * oy + y)
+            grid.cells[dst:dst + local_w - 2] = cells[src:src + local_w - 2].translate(_PATH_ONLY)
+    finally:
+        grid.close()
+
+
+def _stitch(grid: MazeGrid, xs: List[int], ys: List[int], cols: int, rows: int, rng: random.Random):
+    """Open one wall cell per edge of a random spanning tree over the regions"""
+    nx, ny = len(xs), len(ys)
+    bounds_x = xs + [cols]
+    bounds_y = ys + [rows]
+
+    # Region graph edges: region * 2 (to the right) or region * 2 + 1 (below)
+    edges = []
+    for ry in range(ny):
+        for rx in range(nx):
+            region = ry * nx + rx
+            if rx + 1 < nx:
+                edges.append(region * 2)
+            if ry + 1 < ny:
+                edges.append(region * 2 + 1)
+    rng.shuffle(edges)
+
+    regions = DisjointSet(nx * ny)
+    for edge in edges:
+        region, down = divmod(edge, 2)
+        if not regions.union(region, region + nx if down else region + 1):
+            continue
+        ry, rx = divmod(region, nx)
+        if down:
+            # Wall row between this region and the one below, at a random lattice column
+            cx = rng.randrange(bounds_x[rx], bounds_x[rx + 1])
+            x, y = 1 + 2 * cx, 2 * bounds_y[ry + 1]
+        else:
+            cy = rng.randrange(bounds_y[ry], bounds_y[ry + 1])
+            x, y = 2 * bounds_x[rx + 1], 1 + 2 * cy
+        grid.set_status(x, y, 1)
+        if regions.count == 1:
+            break
+
+
+def generate_stitched(maze_width: int, maze_height: int, algorithm: str = "Growing_Tree",
+                      seed: Optional[int] = None, workers: Optional[int] = None,
+                      region_cells: int = REGION_CELLS) -> MazeGrid:
+    """
+    Generate a perfect maze region by region across a process pool
+    The same seed and region_cells give the same maze for any worker count
+    """
+    cols = (maze_width - 1) // 2
+    rows = (maze_height - 1) // 2
+    if cols == 0 or rows == 0:
+        return MazeGrid(maze_width, maze_height)
+
+    rng = random.Random(seed)
+    xs, ys = split_lattice(cols, rows, region_cells)
+    bounds_x = xs + [cols]
+    bounds_y = ys + [rows]
+    jobs_regions = [(xs[i], ys[j], bounds_x[i + 1] - xs[i], bounds_y[j + 1] - ys[j])
+                    for j in range(len(ys)) for i in range(len(xs))]
+    region_seeds = [rng.getrandbits(63) for _ in jobs_regions]
+
+    shared = SharedMazeGrid.create(maze_width, maze_height)
+    try:
+        jobs = [(shared.name, region, algorithm, region_seed)
+                for region, region_seed in zip(jobs_regions, region_seeds)]
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(jobs) == 1:
+            for job in jobs:
+                _generate_region(job)
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+                list(executor.map(_generate_region, jobs))
+
+        _stitch(shared, xs, ys, cols, rows, rng)
+        grid = shared.copy()
+    finally:
+        shared.unlink()
+    return grid
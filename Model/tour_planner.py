@@ -0,0 +1,134 @@
+"""
+Tour Planner
+Orders the collectibles of a level: the shortest walk that starts at the
+player, visits every collectible once and ends at the goal.
+
+Up to EXACT_LIMIT collectibles the order is exact (Held-Karp dynamic
+programming over subsets, O(2^k * k^2)); beyond that it is a nearest
+neighbour tour improved with 2-opt. Distances come from a DistanceField
+(tree queries on perfect mazes, one BFS per stop otherwise), and results
+are memoized on it, so they last as long as the maze does.
+"""
+from typing import List, Sequence, Tuple
+from Model.distance_field import DistanceField
+
+# Largest number of collectibles solved exactly
+EXACT_LIMIT = 12
+
+INF = float('inf')
+
+
+def held_karp(dist: Sequence[Sequence[float]]) -> Tuple[float, List[int]]:
+    """
+    Exact shortest open walk over a distance matrix
+    Node 0 is the start and node n - 1 the end; returns (length, order of
+    nodes 1..n-2), or (inf, []) if no finite walk exists
+    """
+    n = len(dist)
+    k = n - 2
+    if k <= 0:
+        return (dist[0][n - 1] if n > 1 else 0), []
+
+    full = 1 << k
+    # best[mask][j]: shortest walk from the start through the points of
+    # mask, ending at point j (bit j of mask); point j is matrix node j + 1
+    best = [[INF] * k for _ in range(full)]
+    came = [[-1] * k for _ in range(full)]
+    for j in range(k):
+        best[1 << j][j] = dist[0][j + 1]
+
+    for mask in range(1, full):
+        row = best[mask]
+        for j in range(k):
+            length = row[j]
+            if length == INF or not (mask >> j) & 1:
+                continue
+            from_j = dist[j + 1]
+            for nxt in range(k):
+                if (mask >> nxt) & 1:
+                    continue
+                candidate = length + from_j[nxt + 1]
+                target = mask | (1 << nxt)
+                if candidate < best[target][nxt]:
+                    best[target][nxt] = candidate
+                    came[target][nxt] = j
+
+    last_row = best[full - 1]
+    length, last = min((last_row[j] + dist[j + 1][n - 1], j) for j in range(k))
+    if length == INF:
+        return INF, []
+
+    order = []
+    mask = full - 1
+    while last >= 0:
+        order.append(last + 1)
+        last, mask = came[mask][last], mask & ~(1 << last)
+    order.reverse()
+    return length, order
+
+
+def _walk_length(dist: Sequence[Sequence[float]], walk: List[int]) -> float:
+    return sum(dist[a][b] for a, b in zip(walk, walk[1:]))
+
+
+def two_opt(dist: Sequence[Sequence[float]]) -> Tuple[float, List[int]]:
+    """
+    Approximate shortest open walk (same contract as held_karp)
+    Nearest neighbour order, then segment reversals while any shortens the walk
+    """
+    n = len(dist)
+    if n <= 2:
+        return held_karp(dist)
+
+    walk = [0]
+    remaining = set(range(1, n - 1))
+    while remaining:
+        here = dist[walk[-1]]
+        nearest = min(remaining, key=lambda node: (here[node], node))
+        walk.append(nearest)
+        remaining.remove(nearest)
+    walk.append(n - 1)
+
+    # Reversing walk[i..j] replaces edges (i-1, i) and (j, j+1) by (i-1, j) and (i, j+1);
+    # the distances are symmetric, so the inner edges keep their length
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, n - 2):
+            a, b = walk[i - 1], walk[i]
+            for j in range(i + 1, n - 1):
+                c, d = walk[j], walk[j + 1]
+                if dist[a][c] + dist[b][d] < dist[a][b] + dist[c][d]:
+                    walk[i:j + 1] = walk[j:i - 1:-1]
+                    b = walk[i]
+                    improved = True
+
+    length = _walk_length(dist, walk)
+    return (INF, []) if length == INF else (length, walk[1:-1])
+
+
+def plan_tour(field: DistanceField, start: Tuple[int, int], goal: Tuple[int, int],
+              points: Sequence[Tuple[int, int]],
+              exact_limit: int = EXACT_LIMIT) -> Tuple[float, List[Tuple[int, int]]]:
+    """
+    Shortest walk start -> every point -> goal on field's maze
+    Returns (length, points in visiting order), or (inf, []) if some point
+    cannot be reached. Exact up to exact_limit points, 2-opt beyond
+    """
+    start, goal = tuple(start), tuple(goal)
+    points = [tuple(p) for p in points]
+    key = (start, goal, tuple(sorted(points)), exact_limit)
+    cached = field.tours.get(key)
+    if cached is not None:
+        return cached[0], list(cached[1])
+
+    nodes = [start] + sorted(points) + [goal]
+    if field.tree is None:
+        field.add_points(nodes[:-1])  # The goal only needs to be a target
+    dist = [[field.distance(a, b) for b in nodes] for a in nodes]
+
+    solve = held_karp if len(points) <= exact_limit else two_opt
+    length, order = solve(dist)
+    result = (length, [nodes[i] for i in order])
+    field.tours[key] = result
+    return result[0], list(result[1])
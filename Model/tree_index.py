@@ -0,0 +1,142 @@
+"""
+Tree Index
+Contains TreeIndex, distance and path queries between any two cells of a
+perfect maze (the open cells form a tree) without searching.
+
+The tree is rooted at the first open cell and walked once in BFS order to
+record each cell's parent and depth. Each cell also gets one jump pointer
+(skew-binary jump pointers), so building stays O(n) in time and memory
+while level-ancestor and lowest-common-ancestor queries take O(log n).
+The distance between a and b is depth[a] + depth[b] - 2 * depth[lca].
+
+Mazes with a loop or several components are detected before the walk;
+the builders then return None and callers fall back to a search.
+"""
+from array import array
+from collections import deque
+from typing import Generator, List, Optional, Tuple
+from Model.adjacency import POPCOUNT, Adjacency
+from Model.maze_solver import run_steps
+
+
+class TreeIndex:
+    """Parent, depth and jump pointer of every open cell of a perfect maze"""
+    __slots__ = ('width', 'root', 'parent', 'depth', 'jump')
+
+    def __init__(self, width: int, root: int, parent: array, depth: array, jump: array):
+        self.width = width
+        self.root = root
+        self.parent = parent
+        self.depth = depth
+        self.jump = jump
+
+    def ancestor(self, index: int, level: int) -> int:
+        """Ancestor of cell index at depth level (level <= its depth)"""
+        depth, jump, parent = self.depth, self.jump, self.parent
+        while depth[index] > level:
+            target = jump[index]
+            index = target if depth[target] >= level else parent[index]
+        return index
+
+    def lca(self, a: int, b: int) -> int:
+        """Lowest common ancestor of flat indices a and b"""
+        depth, jump, parent = self.depth, self.jump, self.parent
+        if depth[a] > depth[b]:
+            a = self.ancestor(a, depth[b])
+        elif depth[b] > depth[a]:
+            b = self.ancestor(b, depth[a])
+        # Jump pointers depend only on depth, so a and b stay level
+        while a != b:
+            if jump[a] != jump[b]:
+                a, b = jump[a], jump[b]
+            else:
+                a, b = parent[a], parent[b]
+        return a
+
+    def distance(self, a: Tuple[int, int], b: Tuple[int, int]) -> int:
+        """Length of the (unique) path between open cells a and b"""
+        width, depth = self.width, self.depth
+        i, j = a[1] * width + a[0], b[1] * width + b[0]
+        return depth[i] + depth[j] - 2 * depth[self.lca(i, j)]
+
+    def path(self, a: Tuple[int, int], b: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Cells of the path from a to b, both included"""
+        width, parent = self.width, self.parent
+        i, j = a[1] * width + a[0], b[1] * width + b[0]
+        top = self.lca(i, j)
+        up, down = [], []
+        while i != top:
+            up.append(i)
+            i = parent[i]
+        while j != top:
+            down.append(j)
+            j = parent[j]
+        up.append(top)
+        up.extend(reversed(down))
+        return [(index % width, index // width) for index in up]
+
+    def contains(self, pos: Tuple[int, int]) -> bool:
+        """Whether pos is an open cell of the tree"""
+        x, y = pos
+        index = y * self.width + x
+        return 0 <= x < self.width and 0 <= index < len(self.depth) and self.depth[index] >= 0
+
+
+def is_tree(adjacency: Adjacency) -> bool:
+    """Quick check that the open cells have exactly one link fewer than cells"""
+    cells = adjacency.open_cells.count(1)
+    links = sum(adjacency.masks.translate(POPCOUNT)) // 2
+    return cells > 0 and links == cells - 1
+
+
+def build_tree_index(adjacency: Adjacency) -> Optional[TreeIndex]:
+    """TreeIndex of the maze, or None if its open cells are not a single tree"""
+    return run_steps(tree_index_steps(adjacency))
+
+
+def tree_index_steps(adjacency: Adjacency, pause_every: int = 0) -> Generator[int, None, Optional[TreeIndex]]:
+    """Resumable build_tree_index: yields pause_every after every pause_every cells"""
+    if not is_tree(adjacency):
+        return None
+
+    size = adjacency.width * adjacency.height
+    masks, offsets = adjacency.masks, adjacency.offsets
+    parent = array('i', [-1]) * size
+    depth = array('i', [-1]) * size
+    jump = array('i', [-1]) * size
+
+    root = adjacency.open_cells.index(1)
+    depth[root] = 0
+    jump[root] = root
+    queue = deque([root])
+    pop, push = queue.popleft, queue.append
+    expanded = 0
+    pause_at = pause_every or -1
+
+    while queue:
+        current = pop()
+        expanded += 1
+        if expanded == pause_at:
+            pause_at += pause_every
+            yield pause_every
+
+        # Children of current share its jump pointer choice: skip two equal
+        # jumps at once, otherwise jump to current itself
+        level = depth[current]
+        up = jump[current]
+        if level - depth[up] == depth[up] - depth[jump[up]]:
+            child_jump = jump[up]
+        else:
+            child_jump = current
+        for offset in offsets[masks[current]]:
+            neighbor = current + offset
+            if depth[neighbor] < 0:
+                parent[neighbor] = current
+                depth[neighbor] = level + 1
+                jump[neighbor] = child_jump
+                push(neighbor)
+
+    # links == cells - 1, so reaching every open cell means no cycle either
+    if expanded != adjacency.open_cells.count(1):
+        return None
+    return TreeIndex(adjacency.width, root, parent, depth, jump)
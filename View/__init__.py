@@ -3,7 +3,12 @@ import os, sys, math, random, pygame, time
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from Model import GenerationModel, SolvingModel
+from Model import GenerationModel, MazePrefetcher
+from Model.maze_prefetcher import build_maze
+from Model.maze_validator import validate_maze
+from Model.distance_field import get_distance_field
+from Model.tour_planner import plan_tour
+from Model.route_planner import RoutePlanner, PlanningJob
 from View.components import Button, Dropdown, ModalHistory, ModalVictory
 from View.components.level_modals import ModalLevelSelect, ModalGameComplete
 from View.sprites import FloatingBanana, MonkeyIdle
@@ -25,6 +30,8 @@ GENERATOR = "None" # DFS, Kruskal, Binary Tree, Wilson, Recursive Division
 MODE = None  # Easy, Medium, Hard
 MAZE_COLS, MAZE_ROWS = 25, 19
 CELL_GAP = 0  # khít nhau
+FLOOR_SEED = 42  # Seed cố định cho floor map (giữ nguyên giữa các level)
+PLAN_EXPANSIONS_PER_FRAME = 20000  # Số node tối đa được mở rộng mỗi frame khi lập lộ trình auto-solve
 
 # Level system configuration
 LEVEL_CONFIGS = {
@@ -34,6 +41,7 @@ LEVEL_CONFIGS = {
         'rows': 7,   # 19 - 12 (6 ô mỗi bên)
         'time_limit': 30,   # 30 giây
         'extra_steps': 10,  # Dư 10 bước
+        # 'maze_file': 'levels/level1.mzf',  # Tùy chọn: dùng mê cung lưu sẵn thay vì sinh ngẫu nhiên
     },
     2: {
         'name': 'Level 2',
@@ -171,6 +179,7 @@ class App:
         
         # Level system
         self.current_level = 1
+        self.maze_seed = None  # Seed của mê cung hiện tại (cùng seed => cùng mê cung)
         self.max_level = 3
         self.level_stats = {}  # Store stats for each level {level: {'time': str, 'steps': int, 'completed': bool}}
         self.showing_level_select = False
@@ -210,11 +219,15 @@ class App:
         self.generating_maze = False
         self.generation_model = None
         self.generation_timer = 0.0
+        self.prefetcher = MazePrefetcher(validate=self.is_playable)  # Sinh trước mê cung của level kế tiếp ở background
         self.generation_speed = 0.001  # Seconds per step (tối ưu: 0.001 để nhanh và mượt hơn)
         
         # Auto solve animation
         self.solving_maze = False
         self.solving_model = None
+        self.route_planner = None  # Phiên lập lộ trình của mê cung hiện tại (cache các chặng)
+        self.auto_label = None  # Thuật toán thực sự dùng cho các chặng, vd "DFS → BFS"
+        self.planning_job = None  # Lộ trình đang lập dần qua từng frame
         self.solution_path = []
         self.solution_index = 0
         self.solve_speed = 0.15  # Seconds per step
@@ -363,12 +376,18 @@ class App:
         self.prepare_sprites()
 
         # prebuild random floor map for repeatability
-        random.seed(42)
-        self.floor_map = [[random.randrange(len(self.floor_tiles)) for _ in range(level_config['cols'])] for _ in range(level_config['rows'])]
+        self.floor_map = self.build_floor_map(level_config['cols'], level_config['rows'])
 
         # Cập nhật scale các nút game ngay sau khi khởi tạo
         self.update_game_buttons()
 
+    def build_floor_map(self, cols, rows):
+        """Floor tile indices for a cols x rows maze, from a private RNG so the
+        global random state (and maze seeds) are left untouched"""
+        rng = random.Random(FLOOR_SEED)
+        tile_count = len(self.floor_tiles)
+        return [[rng.randrange(tile_count) for _ in range(cols)] for _ in range(rows)]
+
     def prepare_sprites(self):
         cell = self.cell_size
         # Clear cache if cell size changed
@@ -733,7 +752,7 @@ class App:
 
     # ---- State transitions
     def goto_start(self):
-        self.save_run(label="Manual" if not self.auto_on else f"Auto ({self.selected_algo or 'None'})")
+        self.save_run(label="Manual" if not self.auto_on else f"Auto ({self.auto_label or self.selected_algo or 'None'})")
         self.start_transition("game", "start")
 
     def goto_game(self):
@@ -764,25 +783,32 @@ class App:
         maze_cols = level_config['cols']
         maze_rows = level_config['rows']
         
-        # Chọn thuật toán ngẫu nhiên
-        generation_algos = ["DFS", "Kruskal", "Binary_Tree", "Wilson", "Recursive_Division"]
-        self.selected_generation_algo = random.choice(generation_algos)
-        
-        # Tạo model KHÔNG có animation
-        self.generation_model = GenerationModel(maze_cols, maze_rows, self.selected_generation_algo)
-        self.generation_model.animated_generation = False  # No animation for transition
-        
-        # Generate maze hoàn chỉnh
-        self.generation_model.generate_maze()
+        # Dùng mê cung lưu sẵn (nếu level có maze_file), hoặc mê cung đã sinh trước
+        # nếu worker đã xong, nếu không thì sinh đồng bộ
+        prefetched = self.prefetcher.take(self.current_level)
+        if level_config.get('maze_file'):
+            self.generation_model = self.load_level_maze(level_config)
+            self.selected_generation_algo = self.generation_model.Algorithm
+            self.maze_seed = self.generation_model.seed
+        elif prefetched is not None:
+            self.generation_model = prefetched
+            self.selected_generation_algo = prefetched.Algorithm
+            self.maze_seed = prefetched.seed
+        else:
+            # Chọn thuật toán ngẫu nhiên, sinh hoàn chỉnh (không animation) và kiểm tra,
+            # sinh lại với seed khác nếu mê cung không chơi được
+            generation_algos = ["DFS", "Kruskal", "Binary_Tree", "Wilson", "Recursive_Division"]
+            self.generation_model = build_maze(maze_cols, maze_rows, random.choice(generation_algos),
+                                               seed=random.getrandbits(32), validate=self.is_playable)
+            self.selected_generation_algo = self.generation_model.Algorithm
+            self.maze_seed = self.generation_model.seed
         
         # Copy maze hoàn chỉnh
         self.maze = self.generation_model.Maze
         self.MazeGenerated = self.generation_model.Maze
         
         # Rebuild floor map với kích thước đúng của level mới
-        import random as rand
-        rand.seed(42)
-        self.floor_map = [[rand.randrange(len(self.floor_tiles)) for _ in range(maze_cols)] for _ in range(maze_rows)]
+        self.floor_map = self.build_floor_map(maze_cols, maze_rows)
         
         # Recompute layout for new level size
         self.compute_layout()
@@ -801,8 +827,33 @@ class App:
             self.showing_game_complete = True
             self.modal_game_complete.show(self.level_stats, self.window_rect.w, self.window_rect.h)
     
+    def is_playable(self, model):
+        """Maze is perfect and the goal (cols-2, rows-2) checked by move() is reachable from start"""
+        return model.validate(goal=(model.maze_width - 2, model.maze_height - 2)).ok
+    
+    def load_level_maze(self, level_config):
+        """Load the level's saved maze file (must match the level size)"""
+        model = GenerationModel.from_file(level_config['maze_file'])
+        if (model.maze_width, model.maze_height) != (level_config['cols'], level_config['rows']):
+            raise ValueError(f"{level_config['maze_file']} is {model.maze_width}x{model.maze_height}, "
+                             f"expected {level_config['cols']}x{level_config['rows']}")
+        return model
+    
+    def prefetch_next_level(self):
+        """Start generating the next level's maze in the background"""
+        next_level = self.current_level + 1
+        if next_level > self.max_level:
+            return
+        level_config = LEVEL_CONFIGS[next_level]
+        if level_config.get('maze_file'):
+            return  # Level dùng mê cung lưu sẵn, không cần sinh trước
+        generation_algos = ["DFS", "Kruskal", "Binary_Tree", "Wilson", "Recursive_Division"]
+        self.prefetcher.prefetch(next_level, level_config['cols'], level_config['rows'],
+                                 random.choice(generation_algos), seed=random.getrandbits(32))
+    
     def back_to_menu(self):
         """Go back to start menu and reset game"""
+        self.prefetcher.cancel()
         self.showing_game_complete = False
         self.current_level = 1
         self.level_stats = {}
@@ -858,9 +909,7 @@ class App:
         self.time_remaining = self.time_limit
         
         # Rebuild floor map for current level size
-        import random as rand
-        rand.seed(42)
-        self.floor_map = [[rand.randrange(len(self.floor_tiles)) for _ in range(maze_cols)] for _ in range(maze_rows)]
+        self.floor_map = self.build_floor_map(maze_cols, maze_rows)
         
         # Recompute layout for new level size
         self.compute_layout()
@@ -905,6 +954,7 @@ class App:
             self.start_auto_solve()
         else:
             # Dừng auto solve
+            self.planning_job = None
             self.solving_maze = False
             self.solution_path = []
             self.solution_index = 0
@@ -921,12 +971,27 @@ class App:
         # Clear old particles
         self.particle_system.clear()
         
-        # Tạo model với animation enabled
-        self.generation_model = GenerationModel(maze_cols, maze_rows, self.selected_generation_algo)
-        self.generation_model.animated_generation = True
+        if level_config.get('maze_file'):
+            # Mê cung lưu sẵn: mở dần đúng các ô trong file (seed không dựng lại được
+            # mê cung ghép vùng, Eller streaming hay Growing_Tree với policy khác)
+            self.generation_model = self.load_level_maze(level_config)
+            self.generation_model.reveal_maze()
+        else:
+            # Trace do prefetcher ghi sẵn (rỗng nếu mê cung được sinh đồng bộ)
+            trace = self.generation_model.generation_steps if self.generation_model else None
+            
+            # Tạo model với animation enabled (cùng seed => cùng mê cung đã chuẩn bị)
+            self.generation_model = GenerationModel(maze_cols, maze_rows, self.selected_generation_algo,
+                                                    seed=self.maze_seed)
+            self.generation_model.animated_generation = True
+            
+            # Generate maze để tạo animation steps
+            self.generation_model.generate_maze()
+            if trace:
+                self.generation_model.replay_steps(trace)
         
-        # Generate maze để tạo animation steps
-        self.generation_model.generate_maze()
+        # Level bắt đầu: sinh trước level kế tiếp
+        self.prefetch_next_level()
         
         # Copy maze trạng thái ban đầu từ model (tường hết)
         self.maze = self.generation_model.Maze
@@ -960,28 +1025,44 @@ class App:
         self.time_limit = level_config['time_limit']
         self.time_remaining = self.time_limit
         
-        # Chọn thuật toán ngẫu nhiên
-        generation_algos = ["DFS", "Kruskal", "Binary_Tree", "Wilson", "Recursive_Division"]
-        self.selected_generation_algo = random.choice(generation_algos)
+        # Lấy mê cung đã sinh trước (nếu worker đã xong), nếu không thì sinh và kiểm tra ngay
+        prefetched = self.prefetcher.take(self.current_level)
+        if level_config.get('maze_file'):
+            # Mê cung lưu sẵn: animation mở dần đúng các ô trong file thay vì sinh lại từ seed
+            self.generation_model = self.load_level_maze(level_config)
+            self.selected_generation_algo = self.generation_model.Algorithm
+            self.maze_seed = self.generation_model.seed
+            self.generation_model.reveal_maze()
+        else:
+            if prefetched is None:
+                generation_algos = ["DFS", "Kruskal", "Binary_Tree", "Wilson", "Recursive_Division"]
+                prefetched = build_maze(maze_cols, maze_rows, random.choice(generation_algos),
+                                        seed=random.getrandbits(32), validate=self.is_playable)
+            self.selected_generation_algo = prefetched.Algorithm
+            self.maze_seed = prefetched.seed
+            
+            # Tạo model với animation enabled và kích thước từ level config
+            self.generation_model = GenerationModel(maze_cols, maze_rows, self.selected_generation_algo,
+                                                    seed=self.maze_seed)
+            self.generation_model.animated_generation = True
+            
+            # Generate maze để tạo animation steps
+            # Model sẽ tự động khởi tạo maze về trạng thái ban đầu khi animated_generation = True
+            self.generation_model.generate_maze()
+            # Phát lại trace đã ghi sẵn thay vì chạy lại thuật toán
+            self.generation_model.replay_steps(prefetched.generation_steps)
 
         # Clear old particles
         self.particle_system.clear()
         
-        # Tạo model với animation enabled và kích thước từ level config
-        self.generation_model = GenerationModel(maze_cols, maze_rows, self.selected_generation_algo)
-        self.generation_model.animated_generation = True
-        
-        # Generate maze để tạo animation steps
-        # Model sẽ tự động khởi tạo maze về trạng thái ban đầu khi animated_generation = True
-        self.generation_model.generate_maze()
+        # Level bắt đầu: sinh trước level kế tiếp
+        self.prefetch_next_level()
         
         # Copy maze trạng thái ban đầu từ model
         self.maze = self.generation_model.Maze
         
         # Rebuild floor map với kích thước đúng của level mới
-        import random as rand
-        rand.seed(42)
-        self.floor_map = [[rand.randrange(len(self.floor_tiles)) for _ in range(maze_cols)] for _ in range(maze_rows)]
+        self.floor_map = self.build_floor_map(maze_cols, maze_rows)
         
         # Bắt đầu animation
         self.generating_maze = True
@@ -1023,95 +1104,44 @@ class App:
         if not start_pos or not end_pos:
             return
         
-        # Build path that collects all collectibles using greedy approach
-        full_path = []
-        current_pos = start_pos
-        remaining_collectibles = list(self.collectibles)
-        
-        # Collect all bananas first using nearest neighbor approach
-        while remaining_collectibles:
-            # Find nearest collectible
-            min_dist = float('inf')
-            nearest = None
-            nearest_path = None
-            
-            for collectible in remaining_collectibles:
-                # Calculate path to this collectible
-                self.solving_model = SolvingModel(self.maze, maze_cols, maze_rows)
-                self.solving_model.start_pos = current_pos
-                self.solving_model.end_pos = collectible
-                
-                if self.solving_model.solve_maze(self.selected_algo):
-                    path_length = len(self.solving_model.solution_path)
-                    if path_length < min_dist:
-                        min_dist = path_length
-                        nearest = collectible
-                        nearest_path = self.solving_model.solution_path
-            
-            if nearest and nearest_path:
-                # Add path to this collectible (excluding start position to avoid duplicates)
-                if full_path:
-                    full_path.extend(nearest_path[1:])
-                else:
-                    full_path.extend(nearest_path)
-                current_pos = nearest
-                remaining_collectibles.remove(nearest)
-            else:
-                # Can't reach any collectible
-                self.auto_on = False
-                return
-        
-        # Finally, go to the end position
-        self.solving_model = SolvingModel(self.maze, maze_cols, maze_rows)
-        self.solving_model.start_pos = current_pos
-        self.solving_model.end_pos = end_pos
+        # Lập lộ trình (các banana theo thứ tự tối ưu rồi về đích) dần qua từng frame;
+        # khỉ bắt đầu đi ngay khi chặng đầu tiên sẵn sàng
+        if self.route_planner is None or not self.route_planner.matches(self.maze):
+            self.route_planner = RoutePlanner(self.maze)
+        self.planning_job = PlanningJob(self.route_planner, start_pos, end_pos, self.collectibles, self.selected_algo)
+        self.solving_model = self.route_planner.solver
+        self.auto_label = None
         
-        if self.solving_model.solve_maze(self.selected_algo):
-            # Add final path (excluding start to avoid duplicate)
-            full_path.extend(self.solving_model.solution_path[1:])
-            
-            self.solution_path = full_path
-            self.solving_maze = True
-            self.solution_index = 0
-            self.solve_timer = 0.0
-            self.paused = False
-        else:
-            # Không tìm thấy đường đi
-            self.auto_on = False
+        self.solution_path = []
+        self.solving_maze = True
+        self.solution_index = 0
+        self.solve_timer = 0.0
+        self.paused = False
+        self.advance_planning()
 
-    def calculate_shortest_path(self, start, end):
-        """Calculate shortest path distance using BFS"""
-        from collections import deque
-        
-        if start == end:
-            return 0
-        
-        # Get level config
-        level_config = LEVEL_CONFIGS[self.current_level]
-        maze_cols = level_config['cols']
-        maze_rows = level_config['rows']
-        
-        queue = deque([(start, 0)])
-        visited = {start}
+    def advance_planning(self):
+        """Chạy tiếp việc lập lộ trình auto-solve trong giới hạn node của một frame"""
+        job = self.planning_job
+        if job is None:
+            return
+        if not self.auto_on:
+            # Auto đã bị tắt / reset - bỏ lộ trình đang lập
+            self.planning_job = None
+            return
         
-        while queue:
-            (x, y), dist = queue.popleft()
-            
-            # Check all 4 directions
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                nx, ny = x + dx, y + dy
-                
-                if (nx, ny) == end:
-                    return dist + 1
-                
-                if (0 <= nx < maze_cols and 0 <= ny < maze_rows and
-                    (nx, ny) not in visited and
-                    self.maze[ny][nx].status != 0):  # Not a wall
-                    visited.add((nx, ny))
-                    queue.append(((nx, ny), dist + 1))
+        job.advance(PLAN_EXPANSIONS_PER_FRAME)
+        if len(job.path) > len(self.solution_path):
+            self.solution_path = job.path
         
-        return float('inf')  # No path found
-    
+        if job.done:
+            self.planning_job = None
+            if job.failed:
+                # Không tìm thấy đường đi
+                self.auto_on = False
+                self.solving_maze = False
+            else:
+                self.auto_label = job.route.label
+
     def calculate_optimal_steps(self):
         """Calculate optimal steps to collect all bananas and reach goal"""
         if not self.collectibles:
@@ -1125,31 +1155,8 @@ class App:
         start = tuple(self.player)
         goal = (maze_cols - 2, maze_rows - 2)
         
-        # Use greedy approach: always go to nearest uncollected banana
-        # This is not always optimal but good approximation
-        current = start
-        remaining = list(self.collectibles)
-        total_distance = 0
-        
-        # Collect all bananas
-        while remaining:
-            # Find nearest banana
-            min_dist = float('inf')
-            nearest = None
-            
-            for banana in remaining:
-                dist = self.calculate_shortest_path(current, banana)
-                if dist < min_dist:
-                    min_dist = dist
-                    nearest = banana
-            
-            if nearest:
-                total_distance += min_dist
-                current = nearest
-                remaining.remove(nearest)
-        
-        # Finally go to goal
-        total_distance += self.calculate_shortest_path(current, goal)
+        # Đường đi ngắn nhất nhặt hết banana rồi về đích (chính xác với ít banana)
+        total_distance, _ = plan_tour(get_distance_field(self.maze), start, goal, self.collectibles)
         
         return total_distance
     
@@ -1163,11 +1170,12 @@ class App:
         maze_rows = level_config['rows']
         extra_steps = level_config['extra_steps']
         
-        # Find all path cells (status = 1)
+        # Find all path cells (status = 1) reachable from the start
+        report = validate_maze(self.maze, (1, 1), (maze_cols-2, maze_rows-2), require_perfect=False)
         path_cells = []
         for y in range(maze_rows):
             for x in range(maze_cols):
-                if self.maze[y][x].status == 1:  # Path cell
+                if self.maze[y][x].status == 1 and report.reachable((x, y)):  # Path cell
                     # Avoid start and end positions
                     if (x, y) != (1, 1) and (x, y) != (maze_cols-2, maze_rows-2):
                         path_cells.append((x, y))
@@ -1190,7 +1198,7 @@ class App:
         duration = self.timer; steps=self.steps
         if duration<=0 and steps<=0: return
         rank = "S" if duration<30 and steps<50 else ("A" if duration<60 else ("B" if duration<120 else "C"))
-        mode = label if "Auto" in label else ("Manual" if not self.auto_on else f"Auto ({self.selected_algo or 'None'})")
+        mode = label if "Auto" in label else ("Manual" if not self.auto_on else f"Auto ({self.auto_label or self.selected_algo or 'None'})")
         self.history.append({"time_str": f"{int(duration//60):02d}:{int(duration%60):02d}", "steps": steps, "rank": rank, "mode": mode})
 
     # ---- Input
@@ -1385,33 +1393,30 @@ class App:
             steps_per_frame = max(1, int(0.016 / self.generation_speed)) if self.generation_speed > 0 else 1
             
             for _ in range(steps_per_frame):
-                if self.generation_model and self.generation_model.current_step < len(self.generation_model.generation_steps):
-                    # Get current step info BEFORE applying
-                    current_step_idx = self.generation_model.current_step
-                    if current_step_idx < len(self.generation_model.generation_steps):
-                        x, y, action = self.generation_model.generation_steps[current_step_idx]
-                        
-                        # Apply next step
-                        has_more = self.generation_model.apply_next_step()
-                        
-                        # Emit particles based on action
-                        if self.maze_rect and self.cell_size:
-                            # Calculate screen position
-                            screen_x = self.maze_rect.x + x * self.cell_size + self.cell_size // 2
-                            screen_y = self.maze_rect.y + y * self.cell_size + self.cell_size // 2
+                if self.generation_model:
+                    # Pull and apply the next step straight from the running algorithm
+                    has_more = self.generation_model.apply_next_step()
+                    step = self.generation_model.last_step
+
+                    # Emit particles based on action
+                    if step is not None and self.maze_rect and self.cell_size:
+                        x, y, action = step
+                        # Calculate screen position
+                        screen_x = self.maze_rect.x + x * self.cell_size + self.cell_size // 2
+                        screen_y = self.maze_rect.y + y * self.cell_size + self.cell_size // 2
                             
-                            if action == 'break_wall':
-                                # Wall breaking - dramatic effect
-                                self.particle_system.emit_wall_break(screen_x, screen_y, self.cell_size)
-                            elif action == 'path':
-                                # Path creation - subtle effect
-                                self.particle_system.emit_path_creation(screen_x, screen_y, self.cell_size)
-                            elif action == 'build_wall':
-                                # Building wall - different color particles
-                                self.particle_system.emit_path_creation(
-                                    screen_x, screen_y, self.cell_size, 
-                                    path_color=(150, 100, 100)
-                                )
+                        if action == 'break_wall':
+                            # Wall breaking - dramatic effect
+                            self.particle_system.emit_wall_break(screen_x, screen_y, self.cell_size)
+                        elif action == 'path':
+                            # Path creation - subtle effect
+                            self.particle_system.emit_path_creation(screen_x, screen_y, self.cell_size)
+                        elif action == 'build_wall':
+                            # Building wall - different color particles
+                            self.particle_system.emit_path_creation(
+                                screen_x, screen_y, self.cell_size, 
+                                path_color=(150, 100, 100)
+                            )
                     
                     # Copy updated maze state
                     self.maze = self.generation_model.Maze
@@ -1431,7 +1436,7 @@ class App:
                         for y in range(maze_rows):
                             for x in range(maze_cols):
                                 if self.maze[y][x].status == 1:
-                                    self.maze[y][x].status = 2  # Start
+                                    self.maze.set_status(x, y, 2)  # Start
                                     self.player = [x, y]
                                     start_found = True
                                     break
@@ -1443,7 +1448,7 @@ class App:
                         for y in range(maze_rows - 1, -1, -1):
                             for x in range(maze_cols - 1, -1, -1):
                                 if self.maze[y][x].status == 1:
-                                    self.maze[y][x].status = 3  # End
+                                    self.maze.set_status(x, y, 3)  # End
                                     end_found = True
                                     break
                             if end_found:
@@ -1469,6 +1474,10 @@ class App:
                     self.generating_maze = False
                     break
         
+        # Lập tiếp lộ trình auto-solve (nếu đang lập)
+        if self.planning_job is not None:
+            self.advance_planning()
+        
         # Update auto solve animation
         if self.solving_maze and self.auto_on and not self.paused:
             self.solve_timer += dt
@@ -1536,8 +1545,8 @@ class App:
                             else:
                                 # Hiển thị modal victory với nút Next
                                 self.modal_victory.show(time_str, self.steps, is_victory=True, show_next=True)
-                else:
-                    # Đã đi hết đường hoặc hết bước
+                elif self.planning_job is None or self.steps_remaining <= 0:
+                    # Đã đi hết đường hoặc hết bước (nếu còn đang lập lộ trình thì chờ chặng tiếp theo)
                     self.solving_maze = False
                     self.auto_on = False
         
@@ -1639,7 +1648,15 @@ class App:
         # chips - căn giữa trong sidebar
         # Hiển thị trạng thái generating nếu đang generate maze
         if self.generating_maze and self.generation_model:
-            status_text = f"Generating... {self.generation_model.current_step}/{len(self.generation_model.generation_steps)}"
+            status_text = f"Generating... {self.generation_model.current_step}"
+            status_color = (255, 255, 100)  # Màu vàng
+            status_label = self.font_small.render(status_text, True, status_color)
+            status_x = sidebar.x + (sidebar.width - status_label.get_width()) // 2
+            status_y = sidebar.y + int(20*scale_factor)
+            self.screen.blit(status_label, (status_x, status_y))
+        elif self.planning_job is not None:
+            # Đang lập lộ trình auto-solve
+            status_text = f"Planning… {len(self.planning_job.legs)} legs"
             status_color = (255, 255, 100)  # Màu vàng
             status_label = self.font_small.render(status_text, True, status_color)
             status_x = sidebar.x + (sidebar.width - status_label.get_width()) // 2
@@ -2076,13 +2093,15 @@ class App:
             
             # Hiệu ứng cho đường đi đang được tạo
             if self.generating_maze and self.generation_model:
-                current_step = self.generation_model.current_step - 1
+                # Chỉ giữ vài bước gần nhất, không cần toàn bộ danh sách steps
+                recent_steps = self.generation_model.recent_steps
+                current_step = len(recent_steps) - 1
                 if current_step >= 0:
                     # Tạo hiệu ứng sáng cho các ô vừa phá tường
                     highlight_range = 8  # Số ô được highlight
                     for i in range(max(0, current_step - highlight_range), current_step + 1):
-                        if i < len(self.generation_model.generation_steps):
-                            step_x, step_y, action = self.generation_model.generation_steps[i]
+                        if i < len(recent_steps):
+                            step_x, step_y, action = recent_steps[i]
                             
                             if action in ['break_wall', 'path']:
                                 # Vẽ hiệu ứng cho path và break_wall
@@ -2336,6 +2355,7 @@ class App:
                 self.draw_game()
 
             pygame.display.flip()
+        self.prefetcher.shutdown()
         pygame.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+"""
+Headless batch maze generation
+Generates N mazes with any GenerationModel algorithm across a process pool
+and writes them to one bit-packed batch file (see Model/maze_io.py).
+
+Usage:
+    python batch_generate.py --algorithm Wilson --width 101 --height 101 --count 1000 -o wilson.mzb
+    python batch_generate.py --info wilson.mzb    # read back a batch or single maze file
+Maze i uses seed (base seed + i), so a batch can be regenerated exactly.
+"""
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple
+
+from Model.maze_generator import GenerationModel, GROWING_TREE_POLICIES
+from Model.maze_io import SEED_LIMIT, MazeBatchWriter, iter_maze_file, pack_cells
+
+ALGORITHMS = ["DFS", "Kruskal", "Binary_Tree", "Wilson", "Recursive_Division", "Eller", "Growing_Tree"]
+
+
+def generate_packed(job: Tuple[int, int, str, str, int]) -> Tuple[int, Tuple[int, int], Tuple[int, int], bytes]:
+    """Worker: generate one maze and return (seed, start, end, packed cells)"""
+    width, height, algorithm, policy, seed = job
+    model = GenerationModel(width, height, algorithm, seed=seed)
+    model.growing_tree_policy = policy
+    model.generate_maze()
+    return seed, model.start_pos, model.end_pos, pack_cells(model.Maze.cells)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a batch of mazes into one packed file")
+    parser.add_argument("--algorithm", "-a", choices=ALGORITHMS, default="DFS")
+    parser.add_argument("--policy", choices=GROWING_TREE_POLICIES, default="newest",
+                        help="cell selection policy for Growing_Tree")
+    parser.add_argument("--width", type=int, default=51, help="maze width in cells (odd)")
+    parser.add_argument("--height", type=int, default=51, help="maze height in cells (odd)")
+    parser.add_argument("--count", "-n", type=int, default=100, help="number of mazes")
+    parser.add_argument("--seed", type=int, default=None, help="base seed (random if omitted)")
+    parser.add_argument("--workers", "-j", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunksize", type=int, default=0, help="jobs per worker task (auto if 0)")
+    parser.add_argument("--output", "-o", default="mazes.mzb")
+    parser.add_argument("--info", metavar="FILE", help="summarize an existing maze or batch file and exit")
+    args = parser.parse_args(argv)
+    # Seeds base .. base + count - 1 must all fit the files' unsigned 64-bit field
+    if args.seed is not None and not (0 <= args.seed and args.seed + args.count <= SEED_LIMIT):
+        parser.error("--seed must be >= 0 and --seed + --count at most 2**64")
+    return args
+
+
+def show_info(path: str):
+    """Read every maze of a maze/batch file and print a summary"""
+    start = time.perf_counter()
+    count = open_cells = 0
+    for grid in iter_maze_file(path):
+        if count == 0:
+            print(f"{path}: {grid.algorithm} {grid.width}x{grid.height}, first seed {grid.seed}")
+        open_cells += sum(grid.to_grid().cells)
+        count += 1
+    elapsed = time.perf_counter() - start
+    print(f"{count} maze(s), {open_cells / max(count, 1):,.1f} open cells per maze, "
+          f"read {count / elapsed:,.1f} mazes/sec")
+
+
+def main():
+    args = parse_args()
+    if args.info:
+        show_info(args.info)
+        return
+    if args.count < 1 or args.width < 3 or args.height < 3:
+        raise SystemExit("count must be >= 1 and the maze at least 3x3")
+    base_seed = args.seed if args.seed is not None else random.getrandbits(32)
+    chunksize = args.chunksize or max(1, args.count // (args.workers * 8))
+    jobs = ((args.width, args.height, args.algorithm, args.policy, base_seed + i) for i in range(args.count))
+
+    start = time.perf_counter()
+    with MazeBatchWriter(args.output, args.width, args.height, args.algorithm) as writer:
+        if args.workers == 1:
+            for result in map(generate_packed, jobs):
+                writer.write(*result)
+        else:
+            with ProcessPoolExecutor(max_workers=args.workers) as executor:
+                for result in executor.map(generate_packed, jobs, chunksize=chunksize):
+                    writer.write(*result)
+    elapsed = time.perf_counter() - start
+
+    cells = args.count * args.width * args.height
+    print(f"{args.count} x {args.algorithm} {args.width}x{args.height} (base seed {base_seed}) -> {args.output}")
+    print(f"{elapsed:.3f}s with {args.workers} worker(s): "
+          f"{args.count / elapsed:,.1f} mazes/sec, {cells / elapsed:,.0f} cells/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark: level-synchronous bidirectional BFS vs the previous version
+
+The previous Bidirectional_Search popped one cell per side in turn and only
+noticed the searches meeting when a popped cell had been seen by the other
+side. It is reproduced here over the same adjacency masks, and both run on
+corner-to-corner queries of one large maze, first as generated (perfect)
+and then with a share of its walls knocked out so that there are loops.
+Path lengths are checked against a plain BFS.
+
+Usage: python benchmarks/bench_bidirectional.py [size] [algorithm] [loop %]
+"""
+import os
+import random
+import sys
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Model import GenerationModel, SolvingModel
+from Model.adjacency import get_adjacency
+from Model.distance_field import bfs_distances
+
+
+def legacy_bidirectional(adjacency, start: int, goal: int):
+    """(path length, nodes expanded) of the alternating single-pop version"""
+    masks, offsets = adjacency.masks, adjacency.offsets
+    seen_start, seen_end = {start: 0}, {goal: 0}
+    queue_start, queue_end = deque([start]), deque([goal])
+    sides = ((queue_start, seen_start, seen_end), (queue_end, seen_end, seen_start))
+    expanded = 0
+    while queue_start or queue_end:
+        for queue, seen, seen_other in sides:
+            if not queue:
+                continue
+            current = queue.popleft()
+            expanded += 1
+            if current in seen_other:
+                return seen[current] + seen_other[current], expanded
+            for offset in offsets[masks[current]]:
+                neighbor = current + offset
+                if neighbor not in seen:
+                    seen[neighbor] = seen[current] + 1
+                    queue.append(neighbor)
+    return None, expanded
+
+
+def knock_walls(grid, share: float, rng: random.Random):
+    """Open a share of the inner wall cells that sit between two open cells"""
+    width, height = grid.width, grid.height
+    for y in range(1, height - 1):
+        for x in range(1, width - 1):
+            if grid.status(x, y) == 0 and rng.random() < share:
+                if (grid.status(x - 1, y) and grid.status(x + 1, y)) or (grid.status(x, y - 1) and grid.status(x, y + 1)):
+                    grid.set_status(x, y, 1)
+
+
+def run(grid, queries):
+    adjacency = get_adjacency(grid)
+    width = grid.width
+    solver = SolvingModel(grid, grid.width, grid.height)
+    totals = {"legacy": [0.0, 0, 0], "level-sync": [0.0, 0, 0]}  # time, nodes, non-shortest paths
+    for start, goal in queries:
+        a, b = start[1] * width + start[0], goal[1] * width + goal[0]
+        shortest = bfs_distances(adjacency, a)[b]
+
+        began = time.perf_counter()
+        length, expanded = legacy_bidirectional(adjacency, a, b)
+        totals["legacy"][0] += time.perf_counter() - began
+        totals["legacy"][1] += expanded
+        totals["legacy"][2] += length != shortest
+
+        solver.start_pos, solver.end_pos = start, goal
+        began = time.perf_counter()
+        solver.solve_maze("Bidirectional")
+        totals["level-sync"][0] += time.perf_counter() - began
+        totals["level-sync"][1] += solver.nodes_expanded
+        totals["level-sync"][2] += solver.path_length - 1 != shortest
+
+    for name, (elapsed, nodes, wrong) in totals.items():
+        print(f"{name:>12} | {elapsed:>8.3f} | {nodes:>12} | {wrong}")
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1001
+    algorithm = sys.argv[2] if len(sys.argv) > 2 else "Wilson"
+    loops = float(sys.argv[3]) / 100 if len(sys.argv) > 3 else 0.05
+    rng = random.Random(0)
+
+    model = GenerationModel(size, size, algorithm, seed=0)
+    grid = model.generate_maze()
+    last = size - 2
+    queries = [((1, 1), (last, last)), ((last, 1), (1, last)), ((1, last // 2 | 1), (last, last // 2 | 1))]
+
+    for label in ("perfect", f"{loops:.0%} walls knocked out"):
+        if label != "perfect":
+            knock_walls(grid, loops, rng)
+        print(f"{algorithm} {size}x{size}, {label}, {len(queries)} queries")
+        print(f"{'version':>12} | {'time (s)':>8} | {'nodes expanded':>12} | non-shortest paths")
+        run(grid, queries)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark: iterative Recursive_Division vs the old recursive version
+
+Runs both implementations with the same seed (each on its own
+random.Random, drawing in the same order) on growing square mazes,
+checks that they build identical mazes, and prints how runtime scales.
+The old version is kept here only as a reference; it hits RecursionError
+once the chamber nesting gets deeper than Python's recursion limit.
+
+Usage: python benchmarks/bench_recursive_division.py [max_size]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Model import GenerationModel, MazeGrid
+
+# Cell status -> 0 (wall) / 1 (anything walkable)
+_OPEN = b'\x00' + b'\x01' * 255
+
+
+def legacy_recursive_division(width: int, height: int, seed: int) -> MazeGrid:
+    """The previous recursive implementation, writing one cell at a time"""
+    rng = random.Random(seed)
+    maze = MazeGrid(width, height)
+    for y in range(height):
+        for x in range(width):
+            if y == 0 or y == height - 1 or x == 0 or x == width - 1:
+                maze.set_status(x, y, 0)
+            else:
+                maze.set_status(x, y, 1)
+
+    def divide(x, y, w, h):
+        if w < 2 or h < 2:
+            return
+        horizontal = rng.choice([True, False])
+        if horizontal and h >= 3:
+            wall_y = y + rng.randrange(1, h, 2)
+            for wx in range(x, x + w):
+                maze.set_status(wx, wall_y, 0)
+            hole_x = x + rng.randrange(0, w)
+            if hole_x % 2 == 0:
+                hole_x += 1 if hole_x < x + w - 1 else -1
+            maze.set_status(hole_x, wall_y, 1)
+            divide(x, y, w, wall_y - y)
+            divide(x, wall_y + 1, w, h - (wall_y - y + 1))
+        elif w >= 3:
+            wall_x = x + rng.randrange(1, w, 2)
+            for wy in range(y, y + h):
+                maze.set_status(wall_x, wy, 0)
+            hole_y = y + rng.randrange(0, h)
+            if hole_y % 2 == 0:
+                hole_y += 1 if hole_y < y + h - 1 else -1
+            maze.set_status(wall_x, hole_y, 1)
+            divide(x, y, wall_x - x, h)
+            divide(wall_x + 1, y, w - (wall_x - x + 1), h)
+
+    divide(1, 1, width - 2, height - 2)
+    return maze
+
+
+def iterative_recursive_division(width: int, height: int, seed: int) -> MazeGrid:
+    return GenerationModel(width, height, "Recursive_Division", seed=seed).generate_maze()
+
+
+def walls(maze: MazeGrid) -> bytes:
+    """Cells as 0 (wall) / 1 (open), ignoring Start/End markers"""
+    return bytes(maze.cells).translate(_OPEN)
+
+
+def timed(func, size, seed=0):
+    start = time.perf_counter()
+    try:
+        maze = func(size, size, seed)
+    except RecursionError:
+        return None, None
+    return time.perf_counter() - start, maze
+
+
+def main():
+    max_size = int(sys.argv[1]) if len(sys.argv) > 1 else 4001
+    sizes = []
+    size = 51
+    while size <= max_size:
+        sizes.append(size)
+        size = size * 2 - 1
+    if sizes[-1] != max_size:
+        sizes.append(max_size)
+
+    print(f"{'size':>11} | {'recursive (s)':>13} | {'iterative (s)':>13} | {'speedup':>7} | same maze")
+    for size in sizes:
+        new_time, new_maze = timed(iterative_recursive_division, size)
+        old_time, old_maze = timed(legacy_recursive_division, size)
+        if old_time is None:
+            old_col, speedup, same = "RecursionError", "-", "-"
+        else:
+            old_col = f"{old_time:.3f}"
+            speedup = f"{old_time / new_time:.1f}x"
+            same = "yes" if walls(old_maze) == walls(new_maze) else "NO"
+        print(f"{size:>5}x{size:<5} | {old_col:>13} | {new_time:>13.3f} | {speedup:>7} | {same}")
+
+
+if __name__ == "__main__":
+    main()
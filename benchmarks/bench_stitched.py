@@ -0,0 +1,59 @@
+"""
+Benchmark: stitched multi-process generation vs one generate_maze() call
+
+Generates one square maze with the single-process generator and with
+generate_maze_parallel() for a few worker counts, checks that every
+stitched maze is perfect (connected, no cycles) and prints the timings.
+
+Usage: python benchmarks/bench_stitched.py [size] [algorithm]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Model import GenerationModel, DisjointSet
+
+
+def is_perfect(grid) -> bool:
+    """Open cells form one tree: connected, and exactly (cells - 1) links"""
+    width, cells = grid.width, grid.cells
+    sets = DisjointSet(len(cells))
+    open_cells = links = 0
+    for index, status in enumerate(cells):
+        if not status:
+            continue
+        open_cells += 1
+        if cells[index + 1]:
+            links += 1
+            sets.union(index, index + 1)
+        if index + width < len(cells) and cells[index + width]:
+            links += 1
+            sets.union(index, index + width)
+    return links == open_cells - 1 and sets.count == len(cells) - open_cells + 1
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 4001
+    algorithm = sys.argv[2] if len(sys.argv) > 2 else "Growing_Tree"
+    cpus = os.cpu_count() or 1
+
+    start = time.perf_counter()
+    GenerationModel(size, size, algorithm, seed=0).generate_maze()
+    single = time.perf_counter() - start
+    print(f"{algorithm} {size}x{size} on {cpus} CPU(s)")
+    print(f"{'mode':>18} | {'time (s)':>8} | {'speedup':>7} | perfect")
+    print(f"{'single process':>18} | {single:>8.2f} | {'1.0x':>7} | -")
+
+    for workers in sorted({1, 2, 4, cpus}):
+        model = GenerationModel(size, size, algorithm, seed=0)
+        start = time.perf_counter()
+        model.generate_maze_parallel(workers=workers)
+        elapsed = time.perf_counter() - start
+        perfect = "yes" if is_perfect(model.Maze) else "NO"
+        print(f"{f'stitched, {workers} proc':>18} | {elapsed:>8.2f} | {single / elapsed:>6.1f}x | {perfect}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""Seed range checks of the batch generation CLI"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch_generate import parse_args
+from Model.maze_io import SEED_LIMIT, MazeBatchWriter
+
+
+@pytest.mark.parametrize("seed, count", [(-1, 1), (SEED_LIMIT - 1, 2), (SEED_LIMIT, 1)])
+def test_rejects_seeds_outside_the_record_field(seed, count):
+    with pytest.raises(SystemExit):
+        parse_args(["--seed", str(seed), "--count", str(count)])
+
+
+def test_accepts_the_last_storable_seed():
+    args = parse_args(["--seed", str(SEED_LIMIT - 2), "--count", "2"])
+    assert args.seed + args.count == SEED_LIMIT
+
+
+def test_batch_writer_rejects_out_of_range_seed(tmp_path):
+    with MazeBatchWriter(str(tmp_path / "mazes.mzb"), 3, 3, "DFS") as writer:
+        with pytest.raises(ValueError):
+            writer.write(-1, (1, 1), (1, 1), bytes(2))
+        assert writer.count == 0
@@ -0,0 +1,31 @@
+"""Maze file round trip and seed range checks"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Model import GenerationModel
+
+
+def test_save_and_load_keep_walls_and_markers(tmp_path):
+    model = GenerationModel(31, 31, "Recursive_Division", seed=3)
+    model.generate_maze()
+    path = str(tmp_path / "maze.mzf")
+    model.save_maze(path)
+
+    loaded = GenerationModel.from_file(path)
+    assert loaded.Algorithm == "Recursive_Division"
+    assert loaded.seed == 3
+    assert loaded.Maze.cells == model.Maze.cells
+
+
+def test_save_rejects_negative_seed_without_touching_the_file(tmp_path):
+    path = tmp_path / "maze.mzf"
+    path.write_bytes(b"keep")
+    model = GenerationModel(11, 11, "DFS", seed=-3)
+    model.generate_maze()
+    with pytest.raises(ValueError):
+        model.save_maze(str(path))
+    assert path.read_bytes() == b"keep"